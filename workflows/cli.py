@@ -1,24 +1,30 @@
 import asyncio
+import functools
+import hashlib
 import json
 import os
+import re
 import subprocess
 import tempfile  # For temporary file handling
+import time
 import webbrowser
+from contextlib import asynccontextmanager, nullcontext
+from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 import typer
 from browser_use import Browser
 from langchain.chat_models.base import BaseChatModel
-
-# Assuming OPENAI_API_KEY is set in the environment
-from langchain_openai import ChatOpenAI
 from patchright.async_api import async_playwright as patchright_async_playwright
 
 from workflow_use.builder.service import BuilderService
 from workflow_use.controller.service import WorkflowController
+from workflow_use.json_utils import json_dumps, json_loads
 from workflow_use.mcp.service import get_mcp_server
 from workflow_use.recorder.service import RecordingService  # Added import
+from workflow_use.thread_utils import run_in_daemon_thread
+from workflow_use.workflow.semantic_extractor import SemanticExtractor
 from workflow_use.workflow.service import Workflow
 
 # Placeholder for recorder functionality
@@ -31,41 +37,103 @@ app = typer.Typer(
 	no_args_is_help=True,
 )
 
-# Default LLM instance to None
-llm_instance: BaseChatModel
-try:
-	llm_instance = ChatOpenAI(model='gpt-4o-mini')
-	page_extraction_llm = ChatOpenAI(model='gpt-4o-mini')
-except Exception as e:
-	typer.secho(f'Error initializing LLM: {e}. Would you like to set your OPENAI_API_KEY?', fg=typer.colors.RED)
-	set_openai_api_key = input('Set OPENAI_API_KEY? (y/n): ')
-	if set_openai_api_key.lower() == 'y':
-		os.environ['OPENAI_API_KEY'] = input('Enter your OPENAI_API_KEY: ')
-		llm_instance = ChatOpenAI(model='gpt-4o')
-		page_extraction_llm = ChatOpenAI(model='gpt-4o-mini')
-
-builder_service = BuilderService(llm=llm_instance) if llm_instance else None
+
+# LLMs and the builder are created on first use, so commands that never call an LLM
+# don't pay for importing langchain_openai or constructing its clients.
+@functools.lru_cache(maxsize=1)
+def get_llm() -> BaseChatModel | None:
+	"""Returns the shared LLM instance, or None if it could not be initialized."""
+	# Assuming OPENAI_API_KEY is set in the environment
+	from langchain_openai import ChatOpenAI
+
+	try:
+		return ChatOpenAI(model='gpt-4o-mini')
+	except Exception as e:
+		typer.secho(f'Error initializing LLM: {e}. Would you like to set your OPENAI_API_KEY?', fg=typer.colors.RED)
+		set_openai_api_key = input('Set OPENAI_API_KEY? (y/n): ')
+		if set_openai_api_key.lower() == 'y':
+			os.environ['OPENAI_API_KEY'] = input('Enter your OPENAI_API_KEY: ')
+			return ChatOpenAI(model='gpt-4o')
+		return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_page_extraction_llm() -> BaseChatModel | None:
+	"""Returns the shared LLM used for page content extraction, or None if no LLM is available."""
+	if not get_llm():
+		return None
+
+	from langchain_openai import ChatOpenAI
+
+	return ChatOpenAI(model='gpt-4o-mini')
+
+
+@functools.lru_cache(maxsize=1)
+def get_builder() -> BuilderService | None:
+	"""Returns the shared BuilderService, or None if no LLM is available."""
+	llm = get_llm()
+	return BuilderService(llm=llm) if llm else None
+
+
 # recorder_service = RecorderService() # Placeholder
 recording_service = (
 	RecordingService()
 )  # Assuming RecordingService does not need LLM, or handle its potential None state if it does.
 
 
+# Element id (`#id`) and `[name=...]` attribute selectors used to derive a target_text
+_SELECTOR_ID_RE = re.compile(r'#([A-Za-z0-9_-]+)')
+_SELECTOR_NAME_RE = re.compile(r'\[name=["\']?([^"\'\]]+)["\']?\]')
+
+
+@asynccontextmanager
+async def browser_session():
+	"""Start a patchright-backed Browser and shut it and its playwright driver down on exit."""
+	playwright = await patchright_async_playwright().start()
+	browser = Browser(playwright=playwright)
+	try:
+		yield browser
+	finally:
+		await browser.close()
+		await playwright.stop()
+
+
+# Directories already created by this process, so repeated helpers skip the mkdir syscalls
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+	"""Creates a directory (and its parents) once per process and returns it."""
+	if path not in _ENSURED_DIRS:
+		path.mkdir(parents=True, exist_ok=True)
+		_ENSURED_DIRS.add(path)
+	return path
+
+
 def get_default_save_dir() -> Path:
 	"""Returns the default save directory for workflows."""
 	# Ensure ./tmp exists for temporary files as well if we use it
-	tmp_dir = Path('./tmp').resolve()
-	tmp_dir.mkdir(parents=True, exist_ok=True)
-	return tmp_dir
+	return _ensure_dir(Path('./tmp').resolve())
+
+
+def _resolve_output_dir(output_dir_str: str) -> Path:
+	"""Resolve and create the directory a workflow is saved in."""
+	return _ensure_dir(Path(output_dir_str).resolve())
+
+
+async def aprompt(text: str, **kwargs):
+	"""typer.prompt run in a daemon thread, so the event loop keeps running while the user types."""
+	return await run_in_daemon_thread(typer.prompt, text, name='cli-prompt', **kwargs)
 
 
 # --- Helper function for building and saving workflow ---
-def _build_and_save_workflow_from_recording(
+async def _build_and_save_workflow_from_recording(
 	recording_path: Path,
 	default_save_dir: Path,
 	is_temp_recording: bool = False,  # To adjust messages if it's from a live recording
 ) -> Path | None:
 	"""Builds a workflow from a recording file, prompts for details, and saves it."""
+	builder_service = get_builder()
 	if not builder_service:
 		typer.secho(
 			'BuilderService not initialized. Cannot build workflow.',
@@ -75,30 +143,48 @@ def _build_and_save_workflow_from_recording(
 
 	prompt_subject = 'recorded' if is_temp_recording else 'provided'
 	typer.echo()  # Add space
-	description: str = typer.prompt(typer.style(f'What is the purpose of this {prompt_subject} workflow?', bold=True))
-
-	typer.echo()  # Add space
-	output_dir_str: str = typer.prompt(
-		typer.style('Where would you like to save the final built workflow?', bold=True)
-		+ f" (e.g., ./my_workflows, press Enter for '{default_save_dir}')",
-		default=str(default_save_dir),
-	)
-	output_dir = Path(output_dir_str).resolve()
-	output_dir.mkdir(parents=True, exist_ok=True)
-
-	typer.echo(f'The final built workflow will be saved in: {typer.style(str(output_dir), fg=typer.colors.CYAN)}')
-	typer.echo()  # Add space
+	description: str = await aprompt(typer.style(f'What is the purpose of this {prompt_subject} workflow?', bold=True))
 
+	# Start building right away: the LLM call runs while the user answers the remaining prompts
 	typer.echo(
 		f'Processing recording ({typer.style(str(recording_path.name), fg=typer.colors.MAGENTA)}) and building workflow...'
 	)
+	build_task = asyncio.create_task(builder_service.build_workflow_from_path(recording_path, description))
+
+	file_stem = recording_path.stem
+	if is_temp_recording:
+		file_stem = file_stem.replace('temp_recording_', '') or 'recorded'
+	default_workflow_filename = f'{file_stem}.workflow.json'
+
+	# Both prompts only need the recording path, so they are answered while the build runs
 	try:
-		workflow_definition = asyncio.run(
-			builder_service.build_workflow_from_path(
-				recording_path,
-				description,
-			)
+		typer.echo()  # Add space
+		output_dir_str: str = await aprompt(
+			typer.style('Where would you like to save the final built workflow?', bold=True)
+			+ f" (e.g., ./my_workflows, press Enter for '{default_save_dir}')",
+			default=str(default_save_dir),
 		)
+		output_dir = await asyncio.to_thread(_resolve_output_dir, output_dir_str)
+
+		typer.echo(f'The final built workflow will be saved in: {typer.style(str(output_dir), fg=typer.colors.CYAN)}')
+		typer.echo()  # Add space
+
+		workflow_output_name: str = await aprompt(
+			typer.style('Enter a name for the generated workflow file', bold=True) + ' (e.g., my_search.workflow.json):',
+			default=default_workflow_filename,
+		)
+	except BaseException:
+		build_task.cancel()
+		raise
+	# Ensure the file name ends with .json
+	if not workflow_output_name.endswith('.json'):
+		workflow_output_name = f'{workflow_output_name}.json'
+	final_workflow_path = output_dir / workflow_output_name
+
+	if not build_task.done():
+		typer.echo('Waiting for the workflow build to finish...')
+	try:
+		workflow_definition = await build_task
 	except FileNotFoundError:
 		typer.secho(
 			f'Error: Recording file not found at {recording_path}. Please ensure it exists.',
@@ -119,22 +205,8 @@ def _build_and_save_workflow_from_recording(
 	typer.secho('Workflow built successfully!', fg=typer.colors.GREEN, bold=True)
 	typer.echo()  # Add space
 
-	file_stem = recording_path.stem
-	if is_temp_recording:
-		file_stem = file_stem.replace('temp_recording_', '') or 'recorded'
-
-	default_workflow_filename = f'{file_stem}.workflow.json'
-	workflow_output_name: str = typer.prompt(
-		typer.style('Enter a name for the generated workflow file', bold=True) + ' (e.g., my_search.workflow.json):',
-		default=default_workflow_filename,
-	)
-	# Ensure the file name ends with .json
-	if not workflow_output_name.endswith('.json'):
-		workflow_output_name = f'{workflow_output_name}.json'
-	final_workflow_path = output_dir / workflow_output_name
-
 	try:
-		asyncio.run(builder_service.save_workflow_to_path(workflow_definition, final_workflow_path))
+		await builder_service.save_workflow_to_path(workflow_definition, final_workflow_path)
 		typer.secho(
 			f'Final workflow definition saved to: {typer.style(str(final_workflow_path.resolve()), fg=typer.colors.BRIGHT_GREEN, bold=True)}',
 			fg=typer.colors.GREEN,  # Overall message color
@@ -146,28 +218,39 @@ def _build_and_save_workflow_from_recording(
 
 
 # --- Helper function for building semantic workflow from recording ---
-def _build_and_save_semantic_workflow_from_recording(
+async def _build_and_save_semantic_workflow_from_recording(
 	recording_path: Path,
 	default_save_dir: Path,
 	is_temp_recording: bool = False,
 	simulate_interactions: bool = False,
 	auto_fix_navigation: bool = False,
+	fast: bool = False,
 ) -> Path | None:
 	"""Builds a semantic workflow from a recording file using visible text mappings."""
-	from workflow_use.workflow.semantic_extractor import SemanticExtractor
-	
+	# Load the recording before prompting, so a missing or malformed file fails fast
+	try:
+		recording_data = json_loads(await asyncio.to_thread(Path(recording_path).read_bytes))
+	except FileNotFoundError:
+		typer.secho(
+			f'Error: Recording file not found at {recording_path}. Please ensure it exists.',
+			fg=typer.colors.RED,
+		)
+		return None
+	except Exception as e:
+		typer.secho(f'Error loading recording: {e}', fg=typer.colors.RED)
+		return None
+
 	prompt_subject = 'recorded' if is_temp_recording else 'provided'
 	typer.echo()  # Add space
-	description: str = typer.prompt(typer.style(f'What is the purpose of this {prompt_subject} workflow?', bold=True))
+	description: str = await aprompt(typer.style(f'What is the purpose of this {prompt_subject} workflow?', bold=True))
 
 	typer.echo()  # Add space
-	output_dir_str: str = typer.prompt(
+	output_dir_str: str = await aprompt(
 		typer.style('Where would you like to save the final semantic workflow?', bold=True)
 		+ f" (e.g., ./my_workflows, press Enter for '{default_save_dir}')",
 		default=str(default_save_dir),
 	)
-	output_dir = Path(output_dir_str).resolve()
-	output_dir.mkdir(parents=True, exist_ok=True)
+	output_dir = await asyncio.to_thread(_resolve_output_dir, output_dir_str)
 
 	typer.echo(f'The final semantic workflow will be saved in: {typer.style(str(output_dir), fg=typer.colors.CYAN)}')
 	typer.echo()  # Add space
@@ -175,24 +258,12 @@ def _build_and_save_semantic_workflow_from_recording(
 	typer.echo(
 		f'Processing recording ({typer.style(str(recording_path.name), fg=typer.colors.MAGENTA)}) and building semantic workflow...'
 	)
-	
-	# Load the recording
-	try:
-		with open(recording_path, 'r') as f:
-			recording_data = json.load(f)
-	except FileNotFoundError:
-		typer.secho(
-			f'Error: Recording file not found at {recording_path}. Please ensure it exists.',
-			fg=typer.colors.RED,
-		)
-		return None
-	except Exception as e:
-		typer.secho(f'Error loading recording: {e}', fg=typer.colors.RED)
-		return None
 
 	# Convert recording to semantic workflow format
 	try:
-		semantic_workflow = asyncio.run(_convert_recording_to_semantic_workflow(recording_data, description, simulate_interactions, auto_fix_navigation))
+		semantic_workflow = await _convert_recording_to_semantic_workflow(
+			recording_data, description, simulate_interactions, auto_fix_navigation, fast=fast
+		)
 	except Exception as e:
 		typer.secho(f'Error converting to semantic workflow: {e}', fg=typer.colors.RED)
 		return None
@@ -212,7 +283,7 @@ def _build_and_save_semantic_workflow_from_recording(
 		file_stem = file_stem.replace('temp_recording_', '') or 'recorded'
 
 	default_workflow_filename = f'{file_stem}.semantic.workflow.json'
-	workflow_output_name: str = typer.prompt(
+	workflow_output_name: str = await aprompt(
 		typer.style('Enter a name for the generated semantic workflow file', bold=True) + ' (e.g., my_search.semantic.workflow.json):',
 		default=default_workflow_filename,
 	)
@@ -222,8 +293,7 @@ def _build_and_save_semantic_workflow_from_recording(
 	final_workflow_path = output_dir / workflow_output_name
 
 	try:
-		with open(final_workflow_path, 'w') as f:
-			json.dump(semantic_workflow, f, indent=2)
+		await asyncio.to_thread(final_workflow_path.write_bytes, json_dumps(semantic_workflow, indent=True))
 		typer.secho(
 			f'Final semantic workflow saved to: {typer.style(str(final_workflow_path.resolve()), fg=typer.colors.BRIGHT_GREEN, bold=True)}',
 			fg=typer.colors.GREEN,
@@ -376,10 +446,91 @@ def _infer_navigation_step(from_url, to_url, all_steps, current_index):
 	return None
 
 
-async def _convert_recording_to_semantic_workflow(recording_data, description, simulate_interactions, auto_fix_navigation=False):
+# Maximum number of pages loaded concurrently while prefetching semantic mappings
+SEMANTIC_PREFETCH_CONCURRENCY = 4
+
+
+# Recorded step types that target an element on the page
+_INTERACTIVE_STEP_TYPES = ('click', 'input', 'select', 'keypress')
+
+# Semantic mappings are cached on disk per URL; set WORKFLOW_NO_CACHE to always re-extract
+SEMANTIC_CACHE_DIR = Path('./tmp/semantic_cache')
+SEMANTIC_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def _semantic_cache_path(url):
+	"""Returns the cache file holding the semantic mapping of a URL."""
+	return SEMANTIC_CACHE_DIR / f'{hashlib.sha1(url.encode()).hexdigest()[:16]}.json'
+
+
+def _load_cached_semantic_mapping(url):
+	"""Returns the cached semantic mapping of a URL, or None if it is missing, stale or caching is disabled."""
+	if os.environ.get('WORKFLOW_NO_CACHE'):
+		return None
+	cache_path = _semantic_cache_path(url)
+	try:
+		if time.time() - cache_path.stat().st_mtime >= SEMANTIC_CACHE_TTL_SECONDS:
+			return None
+		return json_loads(cache_path.read_bytes())
+	except (OSError, ValueError):
+		return None
+
+
+def _store_cached_semantic_mapping(url, semantic_mapping):
+	"""Persists the semantic mapping of a URL for later conversions."""
+	if os.environ.get('WORKFLOW_NO_CACHE') or not semantic_mapping:
+		return
+	cache_path = _semantic_cache_path(url)
+	try:
+		_ensure_dir(cache_path.parent)
+		cache_path.write_bytes(json_dumps(semantic_mapping))
+	except (OSError, TypeError) as e:
+		typer.echo(f"Warning: Could not cache semantic mapping for {url}: {e}")
+
+
+async def _prefetch_semantic_mappings(browser, urls):
+	"""Extract the semantic mapping of each URL concurrently, each in its own tab, reusing cached mappings."""
+	mappings = {}
+	# Cache reads are blocking file I/O, keep them off the event loop
+	cached = await asyncio.gather(*(asyncio.to_thread(_load_cached_semantic_mapping, url) for url in urls))
+	for url, cached_mapping in zip(urls, cached):
+		if cached_mapping is not None:
+			typer.echo(f"Loaded {len(cached_mapping)} cached semantic elements for {url}")
+			mappings[url] = cached_mapping
+
+	urls = [url for url in urls if url not in mappings]
+	if not urls:
+		return mappings
+
+	semaphore = asyncio.Semaphore(SEMANTIC_PREFETCH_CONCURRENCY)
+	context = (await browser.get_current_page()).context
+
+	async def fetch_mapping(url):
+		async with semaphore:
+			page = None
+			try:
+				page = await context.new_page()
+				await page.goto(url, wait_until='load')
+				# Wait a bit for dynamic content to load
+				await asyncio.sleep(2)
+				# SemanticExtractor keeps per-extraction counters, so concurrent extractions need their own instance
+				semantic_mapping = await SemanticExtractor().extract_semantic_mapping(page) or {}
+				typer.echo(f"Extracted {len(semantic_mapping)} semantic elements from {url}")
+				await asyncio.to_thread(_store_cached_semantic_mapping, url, semantic_mapping)
+				return url, semantic_mapping
+			except Exception as e:
+				typer.echo(f"Warning: Could not extract semantic mapping from {url}: {e}")
+				return url, {}
+			finally:
+				if page is not None:
+					await page.close()
+
+	mappings.update(await asyncio.gather(*(fetch_mapping(url) for url in urls)))
+	return mappings
+
+
+async def _convert_recording_to_semantic_workflow(recording_data, description, simulate_interactions, auto_fix_navigation=False, fast=False):
 	"""Convert a recorded workflow to semantic format using target_text fields."""
-	from workflow_use.workflow.semantic_extractor import SemanticExtractor
-	
 	# Extract workflow metadata
 	workflow_name = recording_data.get('name', 'Recorded Workflow')
 	steps = recording_data.get('steps', [])
@@ -405,54 +556,88 @@ async def _convert_recording_to_semantic_workflow(recording_data, description, s
 	else:
 		fixed_steps = filtered_steps
 		typer.echo("⚠️ Skipping auto-fix navigation steps (disabled)")
-	
+
+	# Partition the steps by type once. Navigation URLs are needed up front for the prefetch,
+	# and scroll steps don't depend on the page, so both are built before the browser starts
+	step_types = [step.get('type', '').lower() for step in fixed_steps]
+	step_indices_by_type = {}
+	for i, step_type in enumerate(step_types):
+		step_indices_by_type.setdefault(step_type, []).append(i)
+
+	navigation_urls = list(
+		dict.fromkeys(
+			fixed_steps[i]['url'] for i in step_indices_by_type.get('navigation', []) if fixed_steps[i].get('url')
+		)
+	)
+	scroll_steps = {
+		i: {
+			'description': fixed_steps[i].get('description', 'Scroll page'),
+			'type': 'scroll',
+			'scrollX': fixed_steps[i].get('scrollX', 0),
+			'scrollY': fixed_steps[i].get('scrollY', 0),
+		}
+		for i in step_indices_by_type.get('scroll', [])
+	}
 
 	# Initialize semantic extractor
 	semantic_extractor = SemanticExtractor()
 	
-	# Start browser to process pages
-	playwright = await patchright_async_playwright().start()
-	browser = Browser(playwright=playwright)
-	
 	semantic_steps = []
 	current_url = None
 	semantic_mapping = {}
-	
-	try:
-		for i, step in enumerate(fixed_steps):
-			step_type = step.get('type', '').lower()
-			
+	# Lowercased index of semantic_mapping keys, rebuilt only when the mapping changes
+	indexed_mapping = None
+	semantic_mapping_lower = {}
+	# Main tab and the URL loaded in it; it is only navigated when the live page is needed
+	live_page = None
+	live_url = None
+
+	# In fast mode the browser is skipped entirely when the cache already resolves every step
+	cached_mappings = None
+	if fast and not simulate_interactions:
+		cached_mappings = await asyncio.to_thread(_resolve_steps_from_cached_mappings, fixed_steps, step_types, navigation_urls)
+		if cached_mappings is not None:
+			typer.echo("⚡ All pages are cached and every step resolves - skipping the browser")
+
+	# Start browser to process pages
+	async with browser_session() if cached_mappings is None else nullcontext() as browser:
+		async def sync_live_page():
+			nonlocal live_page, live_url
+			if live_page is None:
+				live_page = await browser.get_current_page()
+			if live_url != current_url:
+				await live_page.goto(current_url, wait_until='load')
+				live_url = current_url
+			return live_page
+
+		# Extract the semantic mapping of every navigated page up front, concurrently
+		if cached_mappings is not None:
+			prefetched_mappings = cached_mappings
+		else:
+			prefetched_mappings = await _prefetch_semantic_mappings(browser, navigation_urls)
+
+		for i, (step, step_type) in enumerate(zip(fixed_steps, step_types)):
 			if step_type == 'navigation':
-				# Navigation step - extract semantic mapping for new page
+				# Navigation step - the semantic mapping for the new page was prefetched above
 				current_url = step.get('url')
+				# An explicit navigation always gets a fresh load, even back to the URL already open,
+				# so later refreshes don't read the state left by earlier simulated interactions
+				live_url = None
 				if current_url:
 					semantic_steps.append({
 						'description': f"Navigate to {current_url}",
 						'type': 'navigation',
 						'url': current_url
 					})
-					
-					# Extract semantic mapping for this page
-					try:
-						page = await browser.get_current_page()
-						await page.goto(current_url)
-						await page.wait_for_load_state()
-						# Wait a bit for dynamic content to load
-						await asyncio.sleep(2)
-						semantic_mapping = await semantic_extractor.extract_semantic_mapping(page)
-						if semantic_mapping is None:
-							semantic_mapping = {}
-						typer.echo(f"Extracted {len(semantic_mapping or {})} semantic elements from {current_url}")
-					except Exception as e:
-						typer.echo(f"Warning: Could not extract semantic mapping from {current_url}: {e}")
-						semantic_mapping = {}
+					semantic_mapping = prefetched_mappings.get(current_url, {})
 			
-			elif step_type in ['click', 'input', 'select', 'keypress']:
+			elif step_type in _INTERACTIVE_STEP_TYPES:
 				# Before processing interactive steps, refresh semantic mapping to catch dynamic changes
-				# This is especially important after form interactions that might show/hide elements
-				if i > 0 and current_url:  # Skip refresh for first step
+				# This is only needed when interactions are simulated: otherwise the page never changes
+				# between steps and the prefetched mapping is still accurate
+				if simulate_interactions and i > 0 and current_url:  # Skip refresh for first step
 					try:
-						page = await browser.get_current_page()
+						page = await sync_live_page()
 						# Small delay to let any previous interactions take effect
 						await asyncio.sleep(1)
 						semantic_mapping = await semantic_extractor.extract_semantic_mapping(page)
@@ -467,24 +652,30 @@ async def _convert_recording_to_semantic_workflow(recording_data, description, s
 				# Ensure semantic_mapping is not None before passing it
 				if semantic_mapping is None:
 					semantic_mapping = {}
-				semantic_step = await _convert_step_to_semantic(step, semantic_mapping, browser, simulate_interactions)
+				if semantic_mapping is not indexed_mapping:
+					semantic_mapping_lower = _index_semantic_mapping(semantic_mapping)
+					indexed_mapping = semantic_mapping
+				semantic_step = _convert_step_to_semantic(step, semantic_mapping_lower)
 				if semantic_step:
 					semantic_steps.append(semantic_step)
+
+				# Optionally simulate the interaction to keep the page state accurate for subsequent steps
+				if simulate_interactions and browser:
+					try:
+						await _simulate_step_interaction(step, browser)
+					except Exception as e:
+						typer.echo(f"Warning: Could not simulate interaction for step: {e}")
 			
 			elif step_type == 'scroll':
 				# Keep scroll steps as-is
-				semantic_steps.append({
-					'description': step.get('description', 'Scroll page'),
-					'type': 'scroll',
-					'scrollX': step.get('scrollX', 0),
-					'scrollY': step.get('scrollY', 0)
-				})
+				scroll_step = scroll_steps[i]
+				semantic_steps.append(scroll_step)
 				
 				# After scroll, refresh semantic mapping as new elements might be visible
-				if current_url:
+				if browser is not None and current_url:
 					try:
-						page = await browser.get_current_page()
-						await page.evaluate(f"window.scrollBy({step.get('scrollX', 0)}, {step.get('scrollY', 0)})")
+						page = await sync_live_page()
+						await page.evaluate(f"window.scrollBy({scroll_step['scrollX']}, {scroll_step['scrollY']})")
 						await asyncio.sleep(1)  # Wait for scroll to complete
 						semantic_mapping = await semantic_extractor.extract_semantic_mapping(page)
 						if semantic_mapping is None:
@@ -510,10 +701,6 @@ async def _convert_recording_to_semantic_workflow(recording_data, description, s
 				typer.echo(f"Warning: Unknown step type '{step_type}' - keeping as-is")
 				semantic_steps.append(step)
 	
-	finally:
-		await browser.close()
-		await playwright.stop()
-	
 	# Build the semantic workflow
 	semantic_workflow = {
 		'workflow_analysis': f'Semantic version of recorded workflow. Uses visible text to identify elements instead of CSS selectors for improved reliability.',
@@ -670,7 +857,7 @@ def _select_best_click_from_group(click_group):
 	return click_group[0]
 
 
-async def _convert_step_to_semantic(step, semantic_mapping, browser, simulate_interactions):
+def _convert_step_to_semantic(step, semantic_mapping_lower):
 	"""Convert a single recorded step to semantic format."""
 	step_type = step.get('type', '').lower()
 	description = step.get('description', '')
@@ -702,7 +889,7 @@ async def _convert_step_to_semantic(step, semantic_mapping, browser, simulate_in
 		typer.echo(f"Using existing target_text from recording: '{target_text}'")
 	elif element_text:
 		# Try to find this text in our semantic mapping
-		target_text = _find_best_semantic_match(element_text, semantic_mapping)
+		target_text = _find_best_semantic_match(element_text, semantic_mapping_lower)
 		if target_text:
 			typer.echo(f"Found semantic match for '{element_text}' -> '{target_text}'")
 		else:
@@ -721,7 +908,7 @@ async def _convert_step_to_semantic(step, semantic_mapping, browser, simulate_in
 		
 		for text in potential_texts:
 			if text.strip():
-				target_text = _find_best_semantic_match(text.strip(), semantic_mapping)
+				target_text = _find_best_semantic_match(text.strip(), semantic_mapping_lower)
 				if target_text:
 					typer.echo(f"Found semantic match from semanticInfo: '{text}' -> '{target_text}'")
 					break
@@ -772,13 +959,6 @@ async def _convert_step_to_semantic(step, semantic_mapping, browser, simulate_in
 	elif step_type == 'keypress' and 'key' in step:
 		semantic_step['key'] = step['key']
 	
-	# Optionally simulate the interaction to keep the page state accurate for subsequent steps
-	if simulate_interactions and browser:
-		try:
-			await _simulate_step_interaction(step, browser)
-		except Exception as e:
-			typer.echo(f"Warning: Could not simulate interaction for step: {e}")
-	
 	return semantic_step
 
 
@@ -815,25 +995,62 @@ async def _simulate_step_interaction(step, browser):
 		pass
 
 
-def _find_best_semantic_match(element_text, semantic_mapping):
-	"""Find the best semantic match for element text."""
-	if not element_text or not semantic_mapping:
-		return None
-	
+def _index_semantic_mapping(semantic_mapping):
+	"""Build the lowercased key -> original key lookup used by _find_best_semantic_match."""
+	semantic_mapping_lower = {}
+	for text_key in semantic_mapping:
+		# Keep the first key when several only differ by case, like the original linear scan did
+		semantic_mapping_lower.setdefault(text_key.lower(), text_key)
+	return semantic_mapping_lower
+
+
+def _match_semantic_key(element_text, semantic_mapping_lower):
+	"""Returns the semantic mapping key matching element text exactly or partially, or None."""
 	element_text_lower = element_text.lower().strip()
 	
 	# Exact match first
-	for text_key in semantic_mapping.keys():
-		if text_key.lower() == element_text_lower:
-			return text_key
+	exact_match = semantic_mapping_lower.get(element_text_lower)
+	if exact_match is not None:
+		return exact_match
 	
-	# Partial match
-	for text_key in semantic_mapping.keys():
-		if element_text_lower in text_key.lower() or text_key.lower() in element_text_lower:
+	# Partial match in a single scan, keeping the first key in mapping order like the original matcher
+	for text_key_lower, text_key in semantic_mapping_lower.items():
+		if element_text_lower in text_key_lower or text_key_lower in element_text_lower:
 			return text_key
-	
+
+	return None
+
+
+def _find_best_semantic_match(element_text, semantic_mapping_lower):
+	"""Find the best semantic match for element text."""
+	if not element_text or not semantic_mapping_lower:
+		return None
+
+	match = _match_semantic_key(element_text, semantic_mapping_lower)
 	# If no good match, return original text (the semantic executor will try to find it)
-	return element_text
+	return match if match is not None else element_text
+
+
+def _resolve_steps_from_cached_mappings(steps, step_types, navigation_urls):
+	"""Returns the cached mapping of every navigated URL if they resolve every interactive step, otherwise None."""
+	cached_mappings = {}
+	for url in navigation_urls:
+		cached_mapping = _load_cached_semantic_mapping(url)
+		if cached_mapping is None:
+			return None
+		cached_mappings[url] = cached_mapping
+
+	indexed_mapping = None
+	for step, step_type in zip(steps, step_types):
+		if step_type == 'navigation' and step.get('url'):
+			indexed_mapping = _index_semantic_mapping(cached_mappings[step['url']])
+		elif step_type in _INTERACTIVE_STEP_TYPES:
+			if step.get('target_text') or step.get('targetText'):
+				continue
+			element_text = (step.get('elementText') or '').strip()
+			if not element_text or indexed_mapping is None or _match_semantic_key(element_text, indexed_mapping) is None:
+				return None
+	return cached_mappings
 
 
 def _extract_target_from_selector(css_selector):
@@ -841,19 +1058,27 @@ def _extract_target_from_selector(css_selector):
 	if not css_selector:
 		return None
 	
-	# Try to extract ID
-	if '#' in css_selector:
-		id_part = css_selector.split('#')[1].split('[')[0].split('.')[0]
-		if id_part:
-			return id_part
-	
-	# Try to extract name from attribute selector
-	if '[name=' in css_selector:
-		name_match = css_selector.split('[name=')[1].split(']')[0].strip('"\'')
-		if name_match:
-			return name_match
-	
-	return None
+	# Try to extract ID, then fall back to the name from an attribute selector
+	match = _SELECTOR_ID_RE.search(css_selector) or _SELECTOR_NAME_RE.search(css_selector)
+	return match.group(1) if match else None
+
+
+def _write_temp_recording(captured_recording_model, tmp_dir: Path) -> Path:
+	"""Writes a captured recording to a temporary JSON file and returns its path."""
+	try:
+		payload = json_dumps(captured_recording_model.model_dump(mode='json'), indent=True)
+	except AttributeError:
+		payload = json_dumps(captured_recording_model, indent=True)
+
+	with tempfile.NamedTemporaryFile(
+		mode='wb',
+		suffix='.json',
+		prefix='temp_recording_',
+		delete=False,
+		dir=tmp_dir,
+	) as tmp_file:
+		tmp_file.write(payload)
+	return Path(tmp_file.name)
 
 
 @app.command(
@@ -879,9 +1104,8 @@ def create_workflow():
 	typer.echo('Please follow instructions in the browser. Close the browser or follow prompts to stop recording.')
 	typer.echo()  # Add space
 
-	temp_recording_path = None
-	try:
-		captured_recording_model = asyncio.run(recording_service.capture_workflow())
+	async def _record_and_build():
+		captured_recording_model = await recording_service.capture_workflow()
 
 		if not captured_recording_model:
 			typer.secho(
@@ -893,22 +1117,11 @@ def create_workflow():
 		typer.secho('Recording captured successfully!', fg=typer.colors.GREEN, bold=True)
 		typer.echo()  # Add space
 
-		with tempfile.NamedTemporaryFile(
-			mode='w',
-			suffix='.json',
-			prefix='temp_recording_',
-			delete=False,
-			dir=default_tmp_dir,
-			encoding='utf-8',
-		) as tmp_file:
-			try:
-				tmp_file.write(captured_recording_model.model_dump_json(indent=2))
-			except AttributeError:
-				json.dump(captured_recording_model, tmp_file, indent=2)
-			temp_recording_path = Path(tmp_file.name)
+		# Serialize and write off the event loop; recordings can be large
+		temp_recording_path = await asyncio.to_thread(_write_temp_recording, captured_recording_model, default_tmp_dir)
 
 		# Use the helper function to build and save
-		saved_path = _build_and_save_workflow_from_recording(temp_recording_path, default_tmp_dir, is_temp_recording=True)
+		saved_path = await _build_and_save_workflow_from_recording(temp_recording_path, default_tmp_dir, is_temp_recording=True)
 		if not saved_path:
 			typer.secho(
 				'Failed to complete workflow creation after recording.',
@@ -916,6 +1129,9 @@ def create_workflow():
 			)
 			raise typer.Exit(code=1)
 
+	# Record and build in one event loop so the builder can reuse its clients
+	try:
+		asyncio.run(_record_and_build())
 	except Exception as e:
 		typer.secho(f'An error occurred during workflow creation: {e}', fg=typer.colors.RED)
 		raise typer.Exit(code=1)
@@ -925,7 +1141,14 @@ def create_workflow():
 	name='create-workflow-no-ai',
 	help='Records a new browser interaction and builds a semantic workflow optimized for no-AI execution.',
 )
-def create_workflow_no_ai():
+def create_workflow_no_ai(
+	fast: bool = typer.Option(
+		False,
+		'--fast',
+		'-f',
+		help='Skip the browser when cached semantic mappings already resolve every recorded step',
+	),
+):
 	"""
 	Records browser actions and builds a semantic workflow using target_text fields 
 	instead of CSS selectors, optimized for run-workflow-no-ai execution.
@@ -944,9 +1167,8 @@ def create_workflow_no_ai():
 	typer.echo('Please follow instructions in the browser. Close the browser or follow prompts to stop recording.')
 	typer.echo()  # Add space
 
-	temp_recording_path = None
-	try:
-		captured_recording_model = asyncio.run(recording_service.capture_workflow())
+	async def _record_and_build():
+		captured_recording_model = await recording_service.capture_workflow()
 
 		if not captured_recording_model:
 			typer.secho(
@@ -958,22 +1180,18 @@ def create_workflow_no_ai():
 		typer.secho('Recording captured successfully!', fg=typer.colors.GREEN, bold=True)
 		typer.echo()  # Add space
 
-		with tempfile.NamedTemporaryFile(
-			mode='w',
-			suffix='.json',
-			prefix='temp_recording_',
-			delete=False,
-			dir=default_tmp_dir,
-			encoding='utf-8',
-		) as tmp_file:
-			try:
-				tmp_file.write(captured_recording_model.model_dump_json(indent=2))
-			except AttributeError:
-				json.dump(captured_recording_model, tmp_file, indent=2)
-			temp_recording_path = Path(tmp_file.name)
+		# Serialize and write off the event loop; recordings can be large
+		temp_recording_path = await asyncio.to_thread(_write_temp_recording, captured_recording_model, default_tmp_dir)
 
 		# Use the semantic workflow builder instead of the regular one
-		saved_path = _build_and_save_semantic_workflow_from_recording(temp_recording_path, default_tmp_dir, is_temp_recording=True, simulate_interactions=False, auto_fix_navigation=False)
+		saved_path = await _build_and_save_semantic_workflow_from_recording(
+			temp_recording_path,
+			default_tmp_dir,
+			is_temp_recording=True,
+			simulate_interactions=False,
+			auto_fix_navigation=False,
+			fast=fast,
+		)
 		if not saved_path:
 			typer.secho(
 				'Failed to complete semantic workflow creation after recording.',
@@ -990,6 +1208,9 @@ def create_workflow_no_ai():
 		typer.echo('2. Edit the workflow file to add variables or customize steps')
 		typer.echo('3. The workflow uses visible text mappings for reliable execution!')
 
+	# Record and build in one event loop so the builder can reuse its clients
+	try:
+		asyncio.run(_record_and_build())
 	except Exception as e:
 		typer.secho(f'An error occurred during semantic workflow creation: {e}', fg=typer.colors.RED)
 		raise typer.Exit(code=1)
@@ -1023,7 +1244,7 @@ def build_from_recording_command(
 	)
 	typer.echo()  # Add space
 
-	saved_path = _build_and_save_workflow_from_recording(recording_path, default_save_dir, is_temp_recording=False)
+	saved_path = asyncio.run(_build_and_save_workflow_from_recording(recording_path, default_save_dir, is_temp_recording=False))
 	if not saved_path:
 		typer.secho(f'Failed to build workflow from {recording_path.name}.', fg=typer.colors.RED)
 		raise typer.Exit(code=1)
@@ -1055,6 +1276,12 @@ def build_semantic_from_recording_command(
 		'-n',
 		help='Automatically add missing navigation steps based on URL changes (may add unwanted back/forward navigation)',
 	),
+	fast: bool = typer.Option(
+		False,
+		'--fast',
+		'-f',
+		help='Skip the browser when cached semantic mappings already resolve every recorded step',
+	),
 ):
 	"""
 	Takes a path to a recording JSON file and builds a semantic workflow using target_text fields
@@ -1073,7 +1300,16 @@ def build_semantic_from_recording_command(
 	
 	typer.echo()  # Add space
 
-	saved_path = _build_and_save_semantic_workflow_from_recording(recording_path, default_save_dir, is_temp_recording=False, simulate_interactions=simulate_interactions, auto_fix_navigation=auto_fix_navigation)
+	saved_path = asyncio.run(
+		_build_and_save_semantic_workflow_from_recording(
+			recording_path,
+			default_save_dir,
+			is_temp_recording=False,
+			simulate_interactions=simulate_interactions,
+			auto_fix_navigation=auto_fix_navigation,
+			fast=fast,
+		)
+	)
 	if not saved_path:
 		typer.secho(f'Failed to build semantic workflow from {recording_path.name}.', fg=typer.colors.RED)
 		raise typer.Exit(code=1)
@@ -1113,6 +1349,7 @@ def run_as_tool_command(
 	"""
 	Run the workflow and automatically parse the required variables from the input/prompt that the user provides.
 	"""
+	llm_instance = get_llm()
 	if not llm_instance:
 		typer.secho(
 			'LLM not initialized. Please check your OpenAI API key. Cannot run as tool.',
@@ -1127,7 +1364,7 @@ def run_as_tool_command(
 
 	try:
 		# Pass llm_instance to ensure the workflow can use it if needed for as_tool() or run_with_prompt()
-		workflow_obj = Workflow.load_from_file(str(workflow_path), llm=llm_instance, page_extraction_llm=page_extraction_llm)
+		workflow_obj = Workflow.load_from_file(str(workflow_path), llm=llm_instance, page_extraction_llm=get_page_extraction_llm())
 	except Exception as e:
 		typer.secho(f'Error loading workflow: {e}', fg=typer.colors.RED)
 		raise typer.Exit(code=1)
@@ -1142,7 +1379,7 @@ def run_as_tool_command(
 		typer.echo(typer.style('Result:', bold=True))
 		# Ensure result is JSON serializable for consistent output
 		try:
-			typer.echo(json.dumps(json.loads(result), indent=2))  # Assuming result from run_with_prompt is a JSON string
+			typer.echo(json_dumps(json_loads(result), indent=True).decode('utf-8'))  # Assuming result from run_with_prompt is a JSON string
 		except (json.JSONDecodeError, TypeError):
 			typer.echo(result)  # Fallback to string if not a JSON string or not serializable
 	except Exception as e:
@@ -1150,6 +1387,56 @@ def run_as_tool_command(
 		raise typer.Exit(code=1)
 
 
+# Prebuilt styles and per-type prompts for collecting workflow inputs
+_REQUIRED_STR = typer.style('required', fg=typer.colors.RED)
+_OPTIONAL_STR = typer.style('optional', fg=typer.colors.YELLOW)
+# Input type -> (prompt function, value type passed to it or None)
+_PROMPT_DISPATCH = {
+	'bool': (typer.confirm, None),
+	'number': (typer.prompt, float),
+	'string': (typer.prompt, str),
+}
+
+
+def _prompt_for_workflow_inputs(input_definitions) -> dict:
+	"""Prompts the user for a value for each workflow input definition."""
+	inputs = {}
+	if not input_definitions:
+		typer.echo('No input schema found in the workflow, or no properties defined. Proceeding without inputs.')
+		return inputs
+
+	typer.echo()  # Add space
+	typer.echo(typer.style('Provide values for the following workflow inputs:', bold=True))
+	typer.echo()  # Add space
+
+	# Normalize the definitions once: (name, lowercased type, required, format or None)
+	prepared_inputs = tuple(
+		(input_def.name, input_def.type.lower(), input_def.required, getattr(input_def, 'format', None))
+		for input_def in input_definitions
+	)
+
+	for var_name, var_type, is_required, var_format in prepared_inputs:
+		var_name_styled = typer.style(var_name, fg=typer.colors.CYAN, bold=True)
+		prompt_question = typer.style(f'Enter value for {var_name_styled}', bold=True)
+		status_str = _REQUIRED_STR if is_required else _OPTIONAL_STR
+
+		# Add format information if available
+		format_info_str = f', format: {typer.style(var_format, fg=typer.colors.GREEN)}' if var_format else ''
+
+		full_prompt_text = f'{prompt_question} ({status_str}, type: {var_type}{format_info_str})'
+
+		if var_type not in _PROMPT_DISPATCH:  # Should ideally not happen if schema is validated, but good to have a fallback
+			typer.secho(
+				f"Warning: Unknown type '{var_type}' for variable '{var_name}'. Treating as string.",
+				fg=typer.colors.YELLOW,
+			)
+		prompt_fn, value_type = _PROMPT_DISPATCH.get(var_type, _PROMPT_DISPATCH['string'])
+		inputs[var_name] = prompt_fn(full_prompt_text) if value_type is None else prompt_fn(full_prompt_text, type=value_type)
+		typer.echo()  # Add space after each prompt
+
+	return inputs
+
+
 @app.command(name='run-workflow', help='Runs an existing workflow from a JSON file.')
 def run_workflow_command(
 	workflow_path: Path = typer.Argument(
@@ -1172,92 +1459,46 @@ def run_workflow_command(
 		)
 		typer.echo()  # Add space
 
-		try:
-			# Instantiate Browser and WorkflowController for the Workflow instance
-			# Pass llm_instance for potential agent fallbacks or agentic steps
-			playwright = await patchright_async_playwright().start()
-
-			browser = Browser(playwright=playwright)
-			controller_instance = WorkflowController()  # Add any necessary config if required
-			workflow_obj = Workflow.load_from_file(
-				str(workflow_path),
-				browser=browser,
-				llm=llm_instance,
-				controller=controller_instance,
-				page_extraction_llm=page_extraction_llm,
-			)
-		except Exception as e:
-			typer.secho(f'Error loading workflow: {e}', fg=typer.colors.RED)
-			raise typer.Exit(code=1)
+		async with browser_session() as browser:
+			try:
+				# Instantiate Browser and WorkflowController for the Workflow instance
+				# Pass llm_instance for potential agent fallbacks or agentic steps
+				controller_instance = WorkflowController()  # Add any necessary config if required
+				workflow_obj = Workflow.load_from_file(
+					str(workflow_path),
+					browser=browser,
+					llm=get_llm(),
+					controller=controller_instance,
+					page_extraction_llm=get_page_extraction_llm(),
+				)
+			except Exception as e:
+				typer.secho(f'Error loading workflow: {e}', fg=typer.colors.RED)
+				raise typer.Exit(code=1)
 
-		typer.secho('Workflow loaded successfully.', fg=typer.colors.GREEN, bold=True)
+			typer.secho('Workflow loaded successfully.', fg=typer.colors.GREEN, bold=True)
 
-		inputs = {}
-		input_definitions = workflow_obj.inputs_def  # Access inputs_def from the Workflow instance
+			# Access inputs_def from the Workflow instance
+			inputs = _prompt_for_workflow_inputs(workflow_obj.inputs_def)
 
-		if input_definitions:  # Check if the list is not empty
-			typer.echo()  # Add space
-			typer.echo(typer.style('Provide values for the following workflow inputs:', bold=True))
 			typer.echo()  # Add space
+			typer.echo(typer.style('Running workflow...', bold=True))
 
-			for input_def in input_definitions:
-				var_name_styled = typer.style(input_def.name, fg=typer.colors.CYAN, bold=True)
-				prompt_question = typer.style(f'Enter value for {var_name_styled}', bold=True)
-
-				var_type = input_def.type.lower()  # type is a direct attribute
-				is_required = input_def.required
-
-				type_info_str = f'type: {var_type}'
-				if is_required:
-					status_str = typer.style('required', fg=typer.colors.RED)
-				else:
-					status_str = typer.style('optional', fg=typer.colors.YELLOW)
-
-				# Add format information if available
-				format_info_str = ''
-				if hasattr(input_def, 'format') and input_def.format:
-					format_info_str = f', format: {typer.style(input_def.format, fg=typer.colors.GREEN)}'
-
-				full_prompt_text = f'{prompt_question} ({status_str}, {type_info_str}{format_info_str})'
-
-				input_val = None
-				if var_type == 'bool':
-					input_val = typer.confirm(full_prompt_text)
-				elif var_type == 'number':
-					input_val = typer.prompt(full_prompt_text, type=float)
-				elif var_type == 'string':  # Default to string for other unknown types as well
-					input_val = typer.prompt(full_prompt_text, type=str)
-				else:  # Should ideally not happen if schema is validated, but good to have a fallback
-					typer.secho(
-						f"Warning: Unknown type '{var_type}' for variable '{input_def.name}'. Treating as string.",
-						fg=typer.colors.YELLOW,
-					)
-					input_val = typer.prompt(full_prompt_text, type=str)
-
-				inputs[input_def.name] = input_val
-				typer.echo()  # Add space after each prompt
-		else:
-			typer.echo('No input schema found in the workflow, or no properties defined. Proceeding without inputs.')
-
-		typer.echo()  # Add space
-		typer.echo(typer.style('Running workflow...', bold=True))
-
-		try:
-			# Call run on the Workflow instance
-			# close_browser_at_end=True is the default for Workflow.run, but explicit for clarity
-			result = await workflow_obj.run(inputs=inputs, close_browser_at_end=True)
-
-			typer.secho('\nWorkflow execution completed!', fg=typer.colors.GREEN, bold=True)
-			typer.echo(typer.style('Result:', bold=True))
-			# Output the number of steps executed, similar to previous behavior
-			typer.echo(f'{typer.style(str(len(result.step_results)), bold=True)} steps executed.')
-			# For more detailed results, one might want to iterate through the 'result' list
-			# and print each item, or serialize the whole list to JSON.
-			# For now, sticking to the step count as per original output.
+			try:
+				# Call run on the Workflow instance
+				# close_browser_at_end=True is the default for Workflow.run, but explicit for clarity
+				result = await workflow_obj.run(inputs=inputs, close_browser_at_end=True)
+
+				typer.secho('\nWorkflow execution completed!', fg=typer.colors.GREEN, bold=True)
+				typer.echo(typer.style('Result:', bold=True))
+				# Output the number of steps executed, similar to previous behavior
+				typer.echo(f'{typer.style(str(len(result.step_results)), bold=True)} steps executed.')
+				# For more detailed results, one might want to iterate through the 'result' list
+				# and print each item, or serialize the whole list to JSON.
+				# For now, sticking to the step count as per original output.
 
-		except Exception as e:
-			typer.secho(f'Error running workflow: {e}', fg=typer.colors.RED)
-			raise typer.Exit(code=1)
+			except Exception as e:
+				typer.secho(f'Error running workflow: {e}', fg=typer.colors.RED)
+				raise typer.Exit(code=1)
 
 	return asyncio.run(_run_workflow())
 
@@ -1292,137 +1533,95 @@ def run_workflow_no_ai_command(
 		)
 		typer.echo()  # Add space
 
-		try:
-			# Instantiate Browser for the Workflow instance
-			playwright = await patchright_async_playwright().start()
-
-			browser = Browser(playwright=playwright)
-			# Create a dummy LLM instance since it's required by the constructor but won't be used for interactions
-			dummy_llm = None
-			extraction_llm = None
-			
+		async with browser_session() as browser:
 			try:
-				from langchain_openai import ChatOpenAI
-				dummy_llm = ChatOpenAI(model='gpt-4o-mini')
+				# Semantic interactions don't need an LLM; one is only created when extraction is enabled
+				extraction_llm = None
 				if enable_extraction:
-					extraction_llm = ChatOpenAI(model='gpt-4o-mini')
-					typer.secho('AI extraction enabled - will use LLM for extraction steps only.', fg=typer.colors.BLUE)
+					try:
+						extraction_llm = get_page_extraction_llm()
+					except Exception as e:
+						typer.secho(f'Warning: Could not initialize LLM for extraction: {e}', fg=typer.colors.YELLOW)
+					if extraction_llm:
+						typer.secho('AI extraction enabled - will use LLM for extraction steps only.', fg=typer.colors.BLUE)
+					else:
+						typer.secho('Continuing with basic extraction fallback...', fg=typer.colors.YELLOW)
+
+				workflow_obj = Workflow.load_from_file(
+					str(workflow_path),
+					browser=browser,
+					llm=None,  # run_with_no_ai never calls the agent LLM
+					page_extraction_llm=extraction_llm,  # Will be used for extraction steps if enabled
+				)
 			except Exception as e:
-				if enable_extraction:
-					typer.secho(f'Warning: Could not initialize LLM for extraction: {e}', fg=typer.colors.YELLOW)
-					typer.secho('Continuing with basic extraction fallback...', fg=typer.colors.YELLOW)
-			
-			workflow_obj = Workflow.load_from_file(
-				str(workflow_path),
-				browser=browser,
-				llm=dummy_llm,  # Won't be used in run_with_no_ai for interactions
-				page_extraction_llm=extraction_llm,  # Will be used for extraction steps if enabled
-			)
-		except Exception as e:
-			typer.secho(f'Error loading workflow: {e}', fg=typer.colors.RED)
-			raise typer.Exit(code=1)
+				typer.secho(f'Error loading workflow: {e}', fg=typer.colors.RED)
+				raise typer.Exit(code=1)
 
-		typer.secho('Workflow loaded successfully.', fg=typer.colors.GREEN, bold=True)
-		if enable_extraction and extraction_llm:
-			typer.secho('Using semantic abstraction mode with AI-powered extraction.', fg=typer.colors.BLUE, bold=True)
-		else:
-			typer.secho('Using semantic abstraction mode (no AI/LLM).', fg=typer.colors.BLUE, bold=True)
+			typer.secho('Workflow loaded successfully.', fg=typer.colors.GREEN, bold=True)
+			if enable_extraction and extraction_llm:
+				typer.secho('Using semantic abstraction mode with AI-powered extraction.', fg=typer.colors.BLUE, bold=True)
+			else:
+				typer.secho('Using semantic abstraction mode (no AI/LLM).', fg=typer.colors.BLUE, bold=True)
 
-		inputs = {}
-		input_definitions = workflow_obj.inputs_def  # Access inputs_def from the Workflow instance
+			# Access inputs_def from the Workflow instance
+			inputs = _prompt_for_workflow_inputs(workflow_obj.inputs_def)
 
-		if input_definitions:  # Check if the list is not empty
-			typer.echo()  # Add space
-			typer.echo(typer.style('Provide values for the following workflow inputs:', bold=True))
 			typer.echo()  # Add space
+			typer.echo(typer.style('Running workflow with semantic abstraction (no AI)...', bold=True))
 
-			for input_def in input_definitions:
-				var_name_styled = typer.style(input_def.name, fg=typer.colors.CYAN, bold=True)
-				prompt_question = typer.style(f'Enter value for {var_name_styled}', bold=True)
-
-				var_type = input_def.type.lower()  # type is a direct attribute
-				is_required = input_def.required
-
-				type_info_str = f'type: {var_type}'
-				if is_required:
-					status_str = typer.style('required', fg=typer.colors.RED)
-				else:
-					status_str = typer.style('optional', fg=typer.colors.YELLOW)
-
-				# Add format information if available
-				format_info_str = ''
-				if hasattr(input_def, 'format') and input_def.format:
-					format_info_str = f', format: {typer.style(input_def.format, fg=typer.colors.GREEN)}'
-
-				full_prompt_text = f'{prompt_question} ({status_str}, {type_info_str}{format_info_str})'
-
-				input_val = None
-				if var_type == 'bool':
-					input_val = typer.confirm(full_prompt_text)
-				elif var_type == 'number':
-					input_val = typer.prompt(full_prompt_text, type=float)
-				elif var_type == 'string':  # Default to string for other unknown types as well
-					input_val = typer.prompt(full_prompt_text, type=str)
-				else:  # Should ideally not happen if schema is validated, but good to have a fallback
-					typer.secho(
-						f"Warning: Unknown type '{var_type}' for variable '{input_def.name}'. Treating as string.",
-						fg=typer.colors.YELLOW,
-					)
-					input_val = typer.prompt(full_prompt_text, type=str)
-
-				inputs[input_def.name] = input_val
-				typer.echo()  # Add space after each prompt
-		else:
-			typer.echo('No input schema found in the workflow, or no properties defined. Proceeding without inputs.')
-
-		typer.echo()  # Add space
-		typer.echo(typer.style('Running workflow with semantic abstraction (no AI)...', bold=True))
-
-		try:
-			# Call run_with_no_ai on the Workflow instance
-			result = await workflow_obj.run_with_no_ai(inputs=inputs, close_browser_at_end=False)
+			try:
+				# Call run_with_no_ai on the Workflow instance
+				result = await workflow_obj.run_with_no_ai(inputs=inputs, close_browser_at_end=False)
 
-			typer.secho('\nWorkflow execution completed!', fg=typer.colors.GREEN, bold=True)
-			typer.echo(typer.style('Result:', bold=True))
-			# Output the number of steps executed
-			typer.echo(f'{typer.style(str(len(result.step_results)), bold=True)} steps executed using semantic abstraction.')
+				typer.secho('\nWorkflow execution completed!', fg=typer.colors.GREEN, bold=True)
+				typer.echo(typer.style('Result:', bold=True))
+				# Output the number of steps executed
+				typer.echo(f'{typer.style(str(len(result.step_results)), bold=True)} steps executed using semantic abstraction.')
 			
-			# Display extraction results if any
-			extraction_results = []
-			for i, step_result in enumerate(result.step_results, 1):
-				if hasattr(step_result, 'extracted_data') and step_result.extracted_data:
-					extraction_results.append((i, step_result.extracted_data))
+				# Display extraction results if any
+				extraction_results = []
+				for i, step_result in enumerate(result.step_results, 1):
+					if hasattr(step_result, 'extracted_data') and step_result.extracted_data:
+						extraction_results.append((i, step_result.extracted_data))
 			
-			if extraction_results:
-				typer.echo()
-				typer.secho('=== EXTRACTION RESULTS ===', fg=typer.colors.CYAN, bold=True)
-				for step_num, extracted_data in extraction_results:
+				if extraction_results:
 					typer.echo()
-					typer.echo(f'{typer.style(f"Step {step_num} Extraction:", bold=True)}')
-					typer.echo(f'  Goal: {typer.style(extracted_data.get("extraction_goal", "N/A"), fg=typer.colors.YELLOW)}')
-					typer.echo(f'  URL: {extracted_data.get("page_url", "N/A")}')
-					typer.echo(f'  Method: {extracted_data.get("extraction_method", "N/A")}')
+					typer.secho('=== EXTRACTION RESULTS ===', fg=typer.colors.CYAN, bold=True)
+					for step_num, extracted_data in extraction_results:
+						typer.echo()
+						typer.echo(f'{typer.style(f"Step {step_num} Extraction:", bold=True)}')
+						typer.echo(f'  Goal: {typer.style(extracted_data.get("extraction_goal", "N/A"), fg=typer.colors.YELLOW)}')
+						typer.echo(f'  URL: {extracted_data.get("page_url", "N/A")}')
+						typer.echo(f'  Method: {extracted_data.get("extraction_method", "N/A")}')
 					
-					if 'extracted_content' in extracted_data:
-						content = extracted_data['extracted_content']
-						# Limit display length for readability
-						if len(content) > 500:
-							content = content[:500] + "... [truncated]"
-						typer.echo(f'  Result:')
-						# Indent the content for better readability
-						for line in content.split('\n'):
-							typer.echo(f'    {line}')
-					elif 'error' in extracted_data:
-						typer.secho(f'  Error: {extracted_data["error"]}', fg=typer.colors.RED)
-				typer.echo()
+						if 'extracted_content' in extracted_data:
+							content = extracted_data['extracted_content']
+							# Limit display length for readability
+							if len(content) > 500:
+								content = content[:500] + "... [truncated]"
+							typer.echo(f'  Result:')
+							# Indent the content for better readability
+							for line in content.split('\n'):
+								typer.echo(f'    {line}')
+						elif 'error' in extracted_data:
+							typer.secho(f'  Error: {extracted_data["error"]}', fg=typer.colors.RED)
+					typer.echo()
 
-		except Exception as e:
-			typer.secho(f'Error running workflow: {e}', fg=typer.colors.RED)
-			raise typer.Exit(code=1)
+			except Exception as e:
+				typer.secho(f'Error running workflow: {e}', fg=typer.colors.RED)
+				raise typer.Exit(code=1)
 
 	return asyncio.run(_run_workflow_no_ai())
 
 
+# Colors used when listing semantic mapping elements; other element types are shown in cyan
+_ELEMENT_TYPE_COLORS = {
+	'button': typer.colors.GREEN,
+	'input': typer.colors.BLUE,
+	'select': typer.colors.MAGENTA,
+}
+
+
 @app.command(name='generate-semantic-mapping', help='Generate semantic mapping for a URL to help with workflow creation.')
 def generate_semantic_mapping_command(
 	url: str = typer.Argument(..., help='URL to generate semantic mapping for'),
@@ -1443,71 +1642,51 @@ def generate_semantic_mapping_command(
 		typer.echo()
 
 		try:
-			from workflow_use.workflow.semantic_extractor import SemanticExtractor
-			from browser_use import Browser
-			from patchright.async_api import async_playwright as patchright_async_playwright
+			async with browser_session() as browser:
+				extractor = SemanticExtractor()
 
-			playwright = await patchright_async_playwright().start()
-			browser = Browser(playwright=playwright)
-			extractor = SemanticExtractor()
+				await browser.start()
+				page = await browser.get_current_page()
+				await page.goto(url, wait_until='load')
 
-			await browser.start()
-			page = await browser.get_current_page()
-			await page.goto(url)
-			await page.wait_for_load_state()
+				# Generate semantic mapping
+				mapping = await extractor.extract_semantic_mapping(page)
+				if mapping is None:
+					mapping = {}
 
-			# Generate semantic mapping
-			mapping = await extractor.extract_semantic_mapping(page)
-			if mapping is None:
-				mapping = {}
-
-			typer.secho(f'Found {len(mapping)} interactive elements', fg=typer.colors.GREEN, bold=True)
-			typer.echo()
-
-			# Display mapping
-			typer.echo(typer.style('=== SEMANTIC MAPPING ===', bold=True))
-			typer.echo()
-
-			for text, element_info in mapping.items():
-				element_type = element_info['element_type']
-				selector = element_info['selectors']
-				class_name = element_info['class']
-				element_id = element_info['id']
-				
-				# Color code by element type
-				if element_type == 'button':
-					text_color = typer.colors.GREEN
-				elif element_type == 'input':
-					text_color = typer.colors.BLUE
-				elif element_type == 'select':
-					text_color = typer.colors.MAGENTA
-				else:
-					text_color = typer.colors.CYAN
+				typer.secho(f'Found {len(mapping)} interactive elements', fg=typer.colors.GREEN, bold=True)
+				typer.echo()
 
-				typer.echo(f'{typer.style(text, fg=text_color, bold=True)}')
-				typer.echo(f'  Type: {element_type}')
-				typer.echo(f'  Class: {class_name or "(none)"}')
-				typer.echo(f'  ID: {element_id or "(none)"}')
-				typer.echo(f'  Selector: {selector}')
+				# Display mapping
+				typer.echo(typer.style('=== SEMANTIC MAPPING ===', bold=True))
 				typer.echo()
 
-			# Save to file if requested
-			if output_file:
 				output_data = {}
 				for text, element_info in mapping.items():
-					output_data[text] = {
-						'class': element_info['class'],
-						'id': element_info['id'], 
-						'selectors': element_info['selectors']
-					}
-
-				with open(output_file, 'w') as f:
-					import json
-					json.dump(output_data, f, indent=2)
+					element_type = element_info['element_type']
+					selector = element_info['selectors']
+					class_name = element_info['class']
+					element_id = element_info['id']
+				
+					# Color code by element type
+					text_color = _ELEMENT_TYPE_COLORS.get(element_type, typer.colors.CYAN)
+
+					# One echo per element; typer.echo still strips the colors when not writing to a terminal
+					typer.echo(
+						f'{typer.style(text, fg=text_color, bold=True)}\n'
+						f'  Type: {element_type}\n'
+						f'  Class: {class_name or "(none)"}\n'
+						f'  ID: {element_id or "(none)"}\n'
+						f'  Selector: {selector}\n'
+					)
 
-				typer.secho(f'Semantic mapping saved to: {output_file}', fg=typer.colors.GREEN)
+					if output_file:
+						output_data[text] = {'class': class_name, 'id': element_id, 'selectors': selector}
 
-			await browser.close()
+				# Save to file if requested, serialized once and written off the event loop
+				if output_file:
+					await asyncio.to_thread(Path(output_file).write_bytes, json_dumps(output_data, indent=True))
+					typer.secho(f'Semantic mapping saved to: {output_file}', fg=typer.colors.GREEN)
 
 		except Exception as e:
 			typer.secho(f'Error generating semantic mapping: {e}', fg=typer.colors.RED)
@@ -1525,6 +1704,11 @@ def create_semantic_workflow_command(
 		'-o',
 		help='Output workflow file (defaults to semantic_workflow.json)',
 	),
+	compact: bool = typer.Option(
+		False,
+		'--compact',
+		help='Write the template as compact JSON instead of indented JSON',
+	),
 ):
 	"""
 	Create a workflow template using semantic text mapping for a given URL.
@@ -1538,103 +1722,85 @@ def create_semantic_workflow_command(
 		typer.echo()
 
 		try:
-			from workflow_use.workflow.semantic_extractor import SemanticExtractor
-			from browser_use import Browser
-			from patchright.async_api import async_playwright as patchright_async_playwright
-
-			playwright = await patchright_async_playwright().start()
-			browser = Browser(playwright=playwright)
-			extractor = SemanticExtractor()
+			async with browser_session() as browser:
+				extractor = SemanticExtractor()
 
-			await browser.start()
-			page = await browser.get_current_page()
-			await page.goto(url)
-			await page.wait_for_load_state()
+				await browser.start()
+				page = await browser.get_current_page()
+				await page.goto(url, wait_until='load')
 
-			# Generate semantic mapping
-			mapping = await extractor.extract_semantic_mapping(page)
-			if mapping is None:
-				mapping = {}
+				# Generate semantic mapping
+				mapping = await extractor.extract_semantic_mapping(page)
+				if mapping is None:
+					mapping = {}
 
-			typer.secho(f'Found {len(mapping)} interactive elements', fg=typer.colors.GREEN, bold=True)
-			typer.echo()
+				typer.secho(f'Found {len(mapping)} interactive elements', fg=typer.colors.GREEN, bold=True)
+				typer.echo()
 
-			# Show available elements
-			typer.echo(typer.style('Available elements for workflow:', bold=True))
-			for i, (text, element_info) in enumerate(mapping.items(), 1):
-				element_type = element_info['element_type']
+				# Show available elements, collecting example steps from the first 5 in the same pass
+				typer.echo(typer.style('Available elements for workflow:', bold=True))
+				example_steps = []
+				for i, (text, element_info) in enumerate(mapping.items(), 1):
+					element_type = element_info['element_type']
 				
-				# Color code by element type
-				if element_type == 'button':
-					text_color = typer.colors.GREEN
-				elif element_type == 'input':
-					text_color = typer.colors.BLUE
-				elif element_type == 'select':
-					text_color = typer.colors.MAGENTA
-				else:
-					text_color = typer.colors.CYAN
-
-				typer.echo(f'{i:2}. {typer.style(text, fg=text_color)} ({element_type})')
-
-			typer.echo()
+					# Color code by element type
+					text_color = _ELEMENT_TYPE_COLORS.get(element_type, typer.colors.CYAN)
+
+					typer.echo(f'{i:2}. {typer.style(text, fg=text_color)} ({element_type})')
+
+					if i > 5:
+						continue
+					if element_type == 'button':
+						example_steps.append({
+							"description": f"Click {text}",
+							"type": "click",
+							"target_text": text,
+							"_comment": "Remove this line - it's just an example"
+						})
+					elif element_type == 'input':
+						example_steps.append({
+							"description": f"Enter value into {text}",
+							"type": "input", 
+							"target_text": text,
+							"value": "{variable_name}",
+							"_comment": "Remove this line - it's just an example. Replace {variable_name} with actual variable."
+						})
 
-			# Create basic workflow template
-			workflow_name = typer.prompt('Enter workflow name', default='Semantic Workflow')
-			workflow_description = typer.prompt('Enter workflow description', default='Automated workflow using semantic text mapping')
-
-			# Create template workflow
-			template = {
-				"workflow_analysis": f"Semantic workflow for {url}. Uses visible text to identify elements instead of CSS selectors.",
-				"name": workflow_name,
-				"description": workflow_description,
-				"version": "1.0",
-				"steps": [
-					{
-						"description": f"Navigate to {url}",
-						"type": "navigation",
-						"url": url
-					}
-				],
-				"input_schema": []
-			}
-
-			# Add some example steps as comments in the JSON
-			example_steps = []
-			for text, element_info in list(mapping.items())[:5]:  # Show first 5 elements as examples
-				element_type = element_info['element_type']
-				
-				if element_type == 'button':
-					example_steps.append({
-						"description": f"Click {text}",
-						"type": "click",
-						"target_text": text,
-						"_comment": "Remove this line - it's just an example"
-					})
-				elif element_type == 'input':
-					example_steps.append({
-						"description": f"Enter value into {text}",
-						"type": "input", 
-						"target_text": text,
-						"value": "{variable_name}",
-						"_comment": "Remove this line - it's just an example. Replace {variable_name} with actual variable."
-					})
+				typer.echo()
 
-			template["example_steps_to_customize"] = example_steps
+				# Create basic workflow template
+				workflow_name = typer.prompt('Enter workflow name', default='Semantic Workflow')
+				workflow_description = typer.prompt('Enter workflow description', default='Automated workflow using semantic text mapping')
+
+				# Create template workflow
+				template = {
+					"workflow_analysis": f"Semantic workflow for {url}. Uses visible text to identify elements instead of CSS selectors.",
+					"name": workflow_name,
+					"description": workflow_description,
+					"version": "1.0",
+					"steps": [
+						{
+							"description": f"Navigate to {url}",
+							"type": "navigation",
+							"url": url
+						}
+					],
+					"input_schema": []
+				}
 
-			# Save template
-			with open(output_path, 'w') as f:
-				import json
-				json.dump(template, f, indent=2)
+				# Add some example steps as comments in the JSON
+				template["example_steps_to_customize"] = example_steps
 
-			typer.secho(f'Workflow template created: {output_path}', fg=typer.colors.GREEN, bold=True)
-			typer.echo()
-			typer.echo(typer.style('Next steps:', bold=True))
-			typer.echo('1. Edit the workflow file to add your specific steps')
-			typer.echo('2. Use target_text field to reference visible text')
-			typer.echo('3. Add input_schema for dynamic values')
-			typer.echo('4. Test with: python cli.py run-workflow-no-ai your_workflow.json')
+				# Save template
+				output_path.write_bytes(json_dumps(template, indent=not compact))
 
-			await browser.close()
+				typer.secho(f'Workflow template created: {output_path}', fg=typer.colors.GREEN, bold=True)
+				typer.echo()
+				typer.echo(typer.style('Next steps:', bold=True))
+				typer.echo('1. Edit the workflow file to add your specific steps')
+				typer.echo('2. Use target_text field to reference visible text')
+				typer.echo('3. Add input_schema for dynamic values')
+				typer.echo('4. Test with: python cli.py run-workflow-no-ai your_workflow.json')
 
 		except Exception as e:
 			typer.secho(f'Error creating semantic workflow: {e}', fg=typer.colors.RED)
@@ -1705,10 +1871,6 @@ def run_workflow_csv_command(
 	"""
 	
 	async def _run_workflow_csv():
-		import csv
-		import pandas as pd
-		from datetime import datetime
-		
 		typer.echo(
 			typer.style(f'Loading workflow from: {typer.style(str(workflow_path.resolve()), fg=typer.colors.MAGENTA)}', bold=True)
 		)
@@ -1753,167 +1915,162 @@ def run_workflow_csv_command(
 		typer.echo()
 		
 		# Load workflow
-		try:
-			playwright = await patchright_async_playwright().start()
-			browser = Browser(playwright=playwright)
-			
-			dummy_llm = None
-			if use_ai and llm_instance:
-				dummy_llm = llm_instance
-			elif use_ai:
-				typer.secho('Warning: AI execution requested but no LLM available. Falling back to semantic mode.', fg=typer.colors.YELLOW)
+		async with browser_session() as browser:
+			try:
+				dummy_llm = get_llm() if use_ai else None
+				if use_ai and not dummy_llm:
+					typer.secho('Warning: AI execution requested but no LLM available. Falling back to semantic mode.', fg=typer.colors.YELLOW)
 			
-			workflow_obj = Workflow.load_from_file(
-				str(workflow_path),
-				browser=browser,
-				llm=dummy_llm,
-			)
-		except Exception as e:
-			typer.secho(f'Error loading workflow: {e}', fg=typer.colors.RED)
-			raise typer.Exit(code=1)
+				workflow_obj = Workflow.load_from_file(
+					str(workflow_path),
+					browser=browser,
+					llm=dummy_llm,
+				)
+			except Exception as e:
+				typer.secho(f'Error loading workflow: {e}', fg=typer.colors.RED)
+				raise typer.Exit(code=1)
 			
-		typer.secho('Workflow loaded successfully.', fg=typer.colors.GREEN, bold=True)
+			typer.secho('Workflow loaded successfully.', fg=typer.colors.GREEN, bold=True)
 		
-		# Validate CSV columns against workflow input schema
-		input_definitions = workflow_obj.inputs_def
-		required_columns = set()
-		optional_columns = set()
+			# Validate CSV columns against workflow input schema
+			input_definitions = workflow_obj.inputs_def
+			required_columns = set()
+			optional_columns = set()
 		
-		for input_def in input_definitions:
-			if input_def.required:
-				required_columns.add(input_def.name)
-			else:
-				optional_columns.add(input_def.name)
+			for input_def in input_definitions:
+				if input_def.required:
+					required_columns.add(input_def.name)
+				else:
+					optional_columns.add(input_def.name)
 		
-		csv_columns = set(df.columns.tolist())
-		missing_required = required_columns - csv_columns
-		extra_columns = csv_columns - required_columns - optional_columns
+			csv_columns = set(df.columns.tolist())
+			missing_required = required_columns - csv_columns
+			extra_columns = csv_columns - required_columns - optional_columns
 		
-		if missing_required:
-			typer.secho(f'Error: Missing required columns in CSV: {", ".join(missing_required)}', fg=typer.colors.RED)
-			typer.echo(f'Required columns: {", ".join(required_columns)}')
-			typer.echo(f'Optional columns: {", ".join(optional_columns)}')
-			raise typer.Exit(code=1)
+			if missing_required:
+				typer.secho(f'Error: Missing required columns in CSV: {", ".join(missing_required)}', fg=typer.colors.RED)
+				typer.echo(f'Required columns: {", ".join(required_columns)}')
+				typer.echo(f'Optional columns: {", ".join(optional_columns)}')
+				raise typer.Exit(code=1)
 		
-		if extra_columns:
-			typer.echo(f'Note: Extra columns in CSV will be ignored: {", ".join(extra_columns)}')
+			if extra_columns:
+				typer.echo(f'Note: Extra columns in CSV will be ignored: {", ".join(extra_columns)}')
 		
-		execution_mode = "AI-powered" if use_ai and dummy_llm else "semantic abstraction (no AI)"
-		typer.secho(f'Using {execution_mode} execution mode.', fg=typer.colors.BLUE, bold=True)
-		typer.echo()
+			execution_mode = "AI-powered" if use_ai and dummy_llm else "semantic abstraction (no AI)"
+			typer.secho(f'Using {execution_mode} execution mode.', fg=typer.colors.BLUE, bold=True)
+			typer.echo()
 		
-		# Prepare results tracking
-		results = []
-		start_time = datetime.now()
+			# Prepare results tracking
+			results = []
+			start_time = datetime.now()
 		
-		# Execute workflows
-		if max_parallel == 1:
-			# Sequential execution
-			typer.echo(typer.style('Starting sequential execution...', bold=True))
-			for idx, row in df.iterrows():
-				typer.echo(f'\n--- Execution {idx + 1 - start_idx} of {len(df)} ---')
-				result = await _execute_single_workflow(workflow_obj, row, idx + 1, use_ai and dummy_llm)
-				results.append(result)
+			# Execute workflows
+			if max_parallel == 1:
+				# Sequential execution
+				typer.echo(typer.style('Starting sequential execution...', bold=True))
+				for idx, row in df.iterrows():
+					typer.echo(f'\n--- Execution {idx + 1 - start_idx} of {len(df)} ---')
+					result = await _execute_single_workflow(workflow_obj, row, idx + 1, use_ai and dummy_llm)
+					results.append(result)
 				
-				# Check if we should stop execution due to critical failures
-				if result['failure_type'] in ['global_failure_limit', 'consecutive_failures']:
-					typer.echo()
-					typer.secho('🛑 STOPPING EXECUTION: Critical workflow failure detected.', fg=typer.colors.BRIGHT_RED, bold=True)
-					typer.echo(f'Reason: {result["error"]}')
-					typer.echo(f'Completed {len(results)} out of {len(df)} planned executions.')
-					break
-		else:
-			# Parallel execution (simplified for now)
-			typer.echo(typer.style(f'Starting parallel execution (max {max_parallel} concurrent)...', bold=True))
-			typer.echo('Note: Parallel execution is experimental and may cause browser conflicts.')
+					# Check if we should stop execution due to critical failures
+					if result['failure_type'] in ['global_failure_limit', 'consecutive_failures']:
+						typer.echo()
+						typer.secho('🛑 STOPPING EXECUTION: Critical workflow failure detected.', fg=typer.colors.BRIGHT_RED, bold=True)
+						typer.echo(f'Reason: {result["error"]}')
+						typer.echo(f'Completed {len(results)} out of {len(df)} planned executions.')
+						break
+			else:
+				# Parallel execution (simplified for now)
+				typer.echo(typer.style(f'Starting parallel execution (max {max_parallel} concurrent)...', bold=True))
+				typer.echo('Note: Parallel execution is experimental and may cause browser conflicts.')
 			
-			# For now, implement as batched sequential to avoid browser conflicts
-			batch_size = max_parallel
-			for i in range(0, len(df), batch_size):
-				batch = df.iloc[i:i + batch_size]
-				typer.echo(f'\n--- Batch {i // batch_size + 1}: Processing rows {i + start_row} to {min(i + batch_size - 1 + start_row, start_row + len(df) - 1)} ---')
+				# For now, implement as batched sequential to avoid browser conflicts
+				batch_size = max_parallel
+				for i in range(0, len(df), batch_size):
+					batch = df.iloc[i:i + batch_size]
+					typer.echo(f'\n--- Batch {i // batch_size + 1}: Processing rows {i + start_row} to {min(i + batch_size - 1 + start_row, start_row + len(df) - 1)} ---')
 				
-				for idx, row in batch.iterrows():
-					typer.echo(f'\nExecution {idx + 1 - start_idx} of {len(df)}')
-					result = await _execute_single_workflow(workflow_obj, row, idx + 1, use_ai and dummy_llm)
-					results.append(result)
+					for idx, row in batch.iterrows():
+						typer.echo(f'\nExecution {idx + 1 - start_idx} of {len(df)}')
+						result = await _execute_single_workflow(workflow_obj, row, idx + 1, use_ai and dummy_llm)
+						results.append(result)
 		
-		# Summary
-		end_time = datetime.now()
-		duration = end_time - start_time
+			# Summary
+			end_time = datetime.now()
+			duration = end_time - start_time
 		
-		successful = sum(1 for r in results if r['status'] == 'success')
-		failed = len(results) - successful
+			successful = sum(1 for r in results if r['status'] == 'success')
+			failed = len(results) - successful
 		
-		# Categorize failures
-		failure_types = {}
-		for result in results:
-			if result['status'] == 'failed':
-				failure_type = result.get('failure_type', 'other')
-				if failure_type not in failure_types:
-					failure_types[failure_type] = []
-				failure_types[failure_type].append(result)
+			# Categorize failures
+			failure_types = {}
+			for result in results:
+				if result['status'] == 'failed':
+					failure_type = result.get('failure_type', 'other')
+					if failure_type not in failure_types:
+						failure_types[failure_type] = []
+					failure_types[failure_type].append(result)
 		
-		typer.echo('\n' + '='*60)
-		typer.secho('EXECUTION SUMMARY', fg=typer.colors.CYAN, bold=True)
-		typer.echo('='*60)
-		typer.echo(f'Total executions: {len(results)}')
-		typer.echo(f'Successful: {typer.style(str(successful), fg=typer.colors.GREEN, bold=True)}')
-		if failed > 0:
-			typer.echo(f'Failed: {typer.style(str(failed), fg=typer.colors.RED, bold=True)}')
-		typer.echo(f'Duration: {duration}')
-		typer.echo(f'Average per execution: {duration / len(results) if results else "N/A"}')
+			typer.echo('\n' + '='*60)
+			typer.secho('EXECUTION SUMMARY', fg=typer.colors.CYAN, bold=True)
+			typer.echo('='*60)
+			typer.echo(f'Total executions: {len(results)}')
+			typer.echo(f'Successful: {typer.style(str(successful), fg=typer.colors.GREEN, bold=True)}')
+			if failed > 0:
+				typer.echo(f'Failed: {typer.style(str(failed), fg=typer.colors.RED, bold=True)}')
+			typer.echo(f'Duration: {duration}')
+			typer.echo(f'Average per execution: {duration / len(results) if results else "N/A"}')
 		
-		if failed > 0:
-			typer.echo('\n' + '-'*40)
-			typer.secho('FAILURE ANALYSIS', fg=typer.colors.YELLOW, bold=True)
-			typer.echo('-'*40)
+			if failed > 0:
+				typer.echo('\n' + '-'*40)
+				typer.secho('FAILURE ANALYSIS', fg=typer.colors.YELLOW, bold=True)
+				typer.echo('-'*40)
 			
-			# Show failure type breakdown
-			for failure_type, failed_results in failure_types.items():
-				count = len(failed_results)
-				if failure_type == 'global_failure_limit':
-					typer.secho(f'  🛑 Global failure limit: {count} (workflow overwhelmed)', fg=typer.colors.BRIGHT_RED)
-				elif failure_type == 'consecutive_failures':
-					typer.secho(f'  🚫 Consecutive failures: {count} (systematic issues)', fg=typer.colors.BRIGHT_RED)
-				elif failure_type == 'element_not_found':
-					typer.secho(f'  🔍 Element not found: {count} (form structure changed)', fg=typer.colors.RED)
-				elif failure_type == 'form_validation':
-					typer.secho(f'  📝 Form validation: {count} (invalid input data)', fg=typer.colors.YELLOW)
-				else:
-					typer.secho(f'  ❓ Other failures: {count}', fg=typer.colors.RED)
+				# Show failure type breakdown
+				for failure_type, failed_results in failure_types.items():
+					count = len(failed_results)
+					if failure_type == 'global_failure_limit':
+						typer.secho(f'  🛑 Global failure limit: {count} (workflow overwhelmed)', fg=typer.colors.BRIGHT_RED)
+					elif failure_type == 'consecutive_failures':
+						typer.secho(f'  🚫 Consecutive failures: {count} (systematic issues)', fg=typer.colors.BRIGHT_RED)
+					elif failure_type == 'element_not_found':
+						typer.secho(f'  🔍 Element not found: {count} (form structure changed)', fg=typer.colors.RED)
+					elif failure_type == 'form_validation':
+						typer.secho(f'  📝 Form validation: {count} (invalid input data)', fg=typer.colors.YELLOW)
+					else:
+						typer.secho(f'  ❓ Other failures: {count}', fg=typer.colors.RED)
 			
-			# Provide actionable recommendations
-			typer.echo('\n' + '-'*40)
-			typer.secho('RECOMMENDATIONS', fg=typer.colors.CYAN, bold=True)
-			typer.echo('-'*40)
-			if 'global_failure_limit' in failure_types or 'consecutive_failures' in failure_types:
-				typer.secho('  • Check if the form structure has changed significantly', fg=typer.colors.CYAN)
-				typer.secho('  • Verify workflow file is compatible with current form version', fg=typer.colors.CYAN)
-				typer.secho('  • Consider re-recording the workflow if layout changed drastically', fg=typer.colors.CYAN)
-			if 'element_not_found' in failure_types:
-				typer.secho('  • Update element selectors in workflow file', fg=typer.colors.CYAN)
-				typer.secho('  • Re-record workflow if form layout changed', fg=typer.colors.CYAN)
-			if 'form_validation' in failure_types:
-				typer.secho('  • Check CSV data for invalid values (missing required fields, wrong formats)', fg=typer.colors.CYAN)
-				typer.secho('  • Verify data types match form expectations', fg=typer.colors.CYAN)
-				typer.secho('  • Check for proper validation rules in the target form', fg=typer.colors.CYAN)
+				# Provide actionable recommendations
+				typer.echo('\n' + '-'*40)
+				typer.secho('RECOMMENDATIONS', fg=typer.colors.CYAN, bold=True)
+				typer.echo('-'*40)
+				if 'global_failure_limit' in failure_types or 'consecutive_failures' in failure_types:
+					typer.secho('  • Check if the form structure has changed significantly', fg=typer.colors.CYAN)
+					typer.secho('  • Verify workflow file is compatible with current form version', fg=typer.colors.CYAN)
+					typer.secho('  • Consider re-recording the workflow if layout changed drastically', fg=typer.colors.CYAN)
+				if 'element_not_found' in failure_types:
+					typer.secho('  • Update element selectors in workflow file', fg=typer.colors.CYAN)
+					typer.secho('  • Re-record workflow if form layout changed', fg=typer.colors.CYAN)
+				if 'form_validation' in failure_types:
+					typer.secho('  • Check CSV data for invalid values (missing required fields, wrong formats)', fg=typer.colors.CYAN)
+					typer.secho('  • Verify data types match form expectations', fg=typer.colors.CYAN)
+					typer.secho('  • Check for proper validation rules in the target form', fg=typer.colors.CYAN)
 		
-		# Save results if requested
-		if output_file:
-			try:
-				results_df = pd.DataFrame(results)
-				results_df.to_csv(output_file, index=False)
-				typer.secho(f'\nResults saved to: {output_file}', fg=typer.colors.GREEN, bold=True)
-			except Exception as e:
-				typer.secho(f'Error saving results: {e}', fg=typer.colors.RED)
+			# Save results if requested
+			if output_file:
+				try:
+					results_df = pd.DataFrame(results)
+					results_df.to_csv(output_file, index=False)
+					typer.secho(f'\nResults saved to: {output_file}', fg=typer.colors.GREEN, bold=True)
+				except Exception as e:
+					typer.secho(f'Error saving results: {e}', fg=typer.colors.RED)
 		
-		if failed > 0:
-			raise typer.Exit(code=1)
+			if failed > 0:
+				raise typer.Exit(code=1)
 	
 	async def _execute_single_workflow(workflow_obj, row_data, row_number, use_ai_mode):
 		"""Execute a single workflow with the given row data."""
-		from datetime import datetime
 		start_time = datetime.now()
 		
 		# Convert row data to inputs dictionary
@@ -2034,6 +2191,8 @@ def mcp_server_command(
 	typer.echo(typer.style('Starting MCP server...', bold=True))
 	typer.echo()  # Add space
 
+	from langchain_openai import ChatOpenAI
+
 	llm_instance = ChatOpenAI(model='gpt-4o')
 	page_extraction_llm = ChatOpenAI(model='gpt-4o-mini')
 
@@ -2051,24 +2210,35 @@ def launch_gui():
 	"""Launch the workflow visualizer GUI."""
 	typer.echo(typer.style('Launching workflow visualizer GUI...', bold=True))
 
-	logs_dir = Path('./tmp/logs')
-	logs_dir.mkdir(parents=True, exist_ok=True)
-	backend_log = open(logs_dir / 'backend.log', 'w')
-	frontend_log = open(logs_dir / 'frontend.log', 'w')
+	logs_dir = _ensure_dir(Path('./tmp/logs'))
+	# The servers write their logs straight to raw file descriptors; the parent doesn't need them once spawned
+	log_flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+	backend_log = os.open(logs_dir / 'backend.log', log_flags, 0o644)
+	frontend_log = os.open(logs_dir / 'frontend.log', log_flags, 0o644)
 
-	backend = subprocess.Popen(['uvicorn', 'backend.api:app', '--reload'], stdout=backend_log, stderr=subprocess.STDOUT)
-	typer.echo(typer.style('Starting frontend...', bold=True))
-	frontend = subprocess.Popen(['npm', 'run', 'dev'], cwd='../ui', stdout=frontend_log, stderr=subprocess.STDOUT)
+	try:
+		backend = subprocess.Popen(['uvicorn', 'backend.api:app', '--reload'], stdout=backend_log, stderr=subprocess.STDOUT)
+		typer.echo(typer.style('Starting frontend...', bold=True))
+		frontend = subprocess.Popen(['npm', 'run', 'dev'], cwd='../ui', stdout=frontend_log, stderr=subprocess.STDOUT)
+	finally:
+		os.close(backend_log)
+		os.close(frontend_log)
 	typer.echo(typer.style('Opening browser...', bold=True))
 	webbrowser.open('http://localhost:5173')
+
+	servers = [backend, frontend]
 	try:
 		typer.echo(typer.style('Press Ctrl+C to stop the GUI and servers.', fg=typer.colors.YELLOW, bold=True))
-		backend.wait()
-		frontend.wait()
+		# Stop as soon as either server exits, instead of waiting on the backend first
+		while all(server.poll() is None for server in servers):
+			time.sleep(0.5)
+		typer.echo(typer.style('\nA server exited, shutting down...', fg=typer.colors.RED, bold=True))
 	except KeyboardInterrupt:
 		typer.echo(typer.style('\nShutting down servers...', fg=typer.colors.RED, bold=True))
-		backend.terminate()
-		frontend.terminate()
+	finally:
+		for server in servers:
+			if server.poll() is None:
+				server.terminate()
 
 
 @app.command(name='generate-csv-template', help='Generate a CSV template file for a workflow to help with bulk execution.')
@@ -2170,7 +2340,7 @@ def generate_csv_template_command(
 			column_name = input_def['name']
 			field_type = input_def.get('type', 'string')
 			is_required = input_def.get('required', False)
-			status = typer.style('required', fg=typer.colors.RED) if is_required else typer.style('optional', fg=typer.colors.YELLOW)
+			status = _REQUIRED_STR if is_required else _OPTIONAL_STR
 			typer.echo(f'  • {typer.style(column_name, fg=typer.colors.CYAN)} ({field_type}, {status})')
 		
 		typer.echo()
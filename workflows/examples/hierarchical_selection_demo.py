@@ -9,9 +9,12 @@ using hierarchical context and intelligent disambiguation.
 import asyncio
 import logging
 from browser_use import Browser
+from workflow_use.json_utils import json_dumps
+from workflow_use.thread_utils import run_in_daemon_thread
 from workflow_use.workflow.semantic_executor import SemanticWorkflowExecutor
-import json
 from datetime import datetime
+from pathlib import Path
+
 
 # Set up logging to see the hierarchical context in action
 logging.basicConfig(level=logging.INFO)
@@ -31,269 +34,104 @@ interaction_mapping = {
 }
 
 # Sample HTML with repeated elements - a common real-world scenario
-SAMPLE_HTML = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Multi-Section Form with Repeated Elements</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
-        .section { 
-            margin: 20px 0; 
-            padding: 20px; 
-            border: 2px solid #333; 
-            background-color: white;
-            border-radius: 8px;
-        }
-        .section h2 { 
-            margin-top: 0; 
-            color: #333; 
-            border-bottom: 2px solid #007bff;
-            padding-bottom: 10px;
-        }
-        .form-row { margin: 15px 0; }
-        .form-row label { 
-            display: inline-block; 
-            width: 120px; 
-            font-weight: bold; 
-        }
-        .form-row input { 
-            padding: 8px; 
-            border: 1px solid #ddd; 
-            border-radius: 4px;
-            width: 200px;
-        }
-        .form-row button { 
-            padding: 10px 20px; 
-            margin: 5px; 
-            border: none; 
-            border-radius: 4px;
-            cursor: pointer;
-            font-weight: bold;
-        }
-        .submit-btn { background-color: #007bff; color: white; }
-        .cancel-btn { background-color: #6c757d; color: white; }
-        .edit-btn { background-color: #ffc107; color: black; }
-        .delete-btn { background-color: #dc3545; color: white; }
-        
-        table { 
-            border-collapse: collapse; 
-            width: 100%; 
-            margin-top: 15px;
-        }
-        td, th { 
-            border: 1px solid #ddd; 
-            padding: 12px; 
-            text-align: left;
-        }
-        th { background-color: #f8f9fa; font-weight: bold; }
-        tr:nth-child(even) { background-color: #f8f9fa; }
-        
-        .highlight { 
-            border: 3px solid #ff6b6b !important; 
-            background-color: #ffe6e6 !important;
-            animation: pulse 2s infinite;
-        }
-        
-        @keyframes pulse {
-            0% { transform: scale(1); }
-            50% { transform: scale(1.05); }
-            100% { transform: scale(1); }
-        }
-        
-        .demo-info {
-            position: fixed;
-            top: 10px;
-            right: 10px;
-            background: #333;
-            color: white;
-            padding: 15px;
-            border-radius: 8px;
-            max-width: 300px;
-            font-size: 12px;
-            z-index: 1000;
-        }
-    </style>
-</head>
-<body>
-    <div class="demo-info">
-        🚀 <strong>Hierarchical Selection Demo</strong><br>
-        This page shows how the system handles repeated text elements<br>
-        <em>Keep this browser open to see the selection in action!</em>
-    </div>
-    
-    <h1>🔄 User Registration Form - Hierarchical Selection Demo</h1>
-    
-    <!-- Personal Information Section -->
-    <section class="section" id="personal-info">
-        <h2>👤 Personal Information</h2>
-        <form id="personal-form">
-            <div class="form-row">
-                <label for="personal-firstName">First Name:</label>
-                <input type="text" id="personal-firstName" name="firstName" placeholder="Enter your first name">
-            </div>
-            <div class="form-row">
-                <label for="personal-email">Email:</label>
-                <input type="email" id="personal-email" name="email" placeholder="Enter your email">
-            </div>
-            <div class="form-row">
-                <button type="submit" class="submit-btn">Submit</button>
-                <button type="button" class="cancel-btn">Cancel</button>
-            </div>
-        </form>
-    </section>
-    
-    <!-- Billing Information Section -->
-    <section class="section" id="billing-info">
-        <h2>💳 Billing Information</h2>
-        <form id="billing-form">
-            <div class="form-row">
-                <label for="billing-firstName">First Name:</label>
-                <input type="text" id="billing-firstName" name="billingFirstName" placeholder="Billing first name">
-            </div>
-            <div class="form-row">
-                <label for="billing-email">Email:</label>
-                <input type="email" id="billing-email" name="billingEmail" placeholder="Billing email">
-            </div>
-            <div class="form-row">
-                <button type="submit" class="submit-btn">Submit</button>
-                <button type="button" class="cancel-btn">Cancel</button>
-            </div>
-        </form>
-    </section>
-    
-    <!-- Data Table with Repeated Actions -->
-    <section class="section" id="user-table">
-        <h2>👥 User Management</h2>
-        <table>
-            <tr>
-                <th>Name</th>
-                <th>Email</th>
-                <th>Actions</th>
-            </tr>
-            <tr>
-                <td>John Doe</td>
-                <td>john@example.com</td>
-                <td>
-                    <button class="edit-btn">Edit</button>
-                    <button class="delete-btn">Delete</button>
-                </td>
-            </tr>
-            <tr>
-                <td>Jane Smith</td>
-                <td>jane@example.com</td>
-                <td>
-                    <button class="edit-btn">Edit</button>
-                    <button class="delete-btn">Delete</button>
-                </td>
-            </tr>
-            <tr>
-                <td>Bob Johnson</td>
-                <td>bob@example.com</td>
-                <td>
-                    <button class="edit-btn">Edit</button>
-                    <button class="delete-btn">Delete</button>
-                </td>
-            </tr>
-        </table>
-    </section>
-    
-    <!-- Newsletter Signup with Similar Elements -->
-    <section class="section" id="newsletter">
-        <h2>📧 Newsletter Signup</h2>
-        <fieldset>
-            <legend>Subscribe to Updates</legend>
-            <form id="newsletter-form">
-                <div class="form-row">
-                    <label for="newsletter-email">Email:</label>
-                    <input type="email" id="newsletter-email" name="newsletterEmail" placeholder="Your email address">
-                </div>
-                <div class="form-row">
-                    <input type="radio" id="daily" name="frequency" value="daily">
-                    <label for="daily">Daily</label>
-                    
-                    <input type="radio" id="weekly" name="frequency" value="weekly">
-                    <label for="weekly">Weekly</label>
-                    
-                    <input type="radio" id="monthly" name="frequency" value="monthly">
-                    <label for="monthly">Monthly</label>
-                </div>
-                <div class="form-row">
-                    <button type="submit" class="submit-btn">Submit</button>
-                    <button type="reset" class="cancel-btn">Cancel</button>
-                </div>
-            </form>
-        </fieldset>
-    </section>
-    
-    <script>
-        // Add visual highlighting when elements are selected
-        function highlightElement(selector) {
-            console.log('Highlighting selector:', selector);
-            
-            // Remove previous highlights
-            document.querySelectorAll('.highlight').forEach(el => el.classList.remove('highlight'));
-            
-            // Try to find the element with the given selector
-            let element = null;
-            try {
-                const elements = document.querySelectorAll(selector);
-                console.log(`Found ${elements.length} elements for selector: ${selector}`);
-                
-                if (elements.length === 1) {
-                    element = elements[0];
-                } else if (elements.length > 1) {
-                    // For multiple elements, show all of them for debugging
-                    console.warn(`Multiple elements found for selector ${selector}:`, elements);
-                    element = elements[0]; // Still highlight the first one
-                }
-            } catch (e) {
-                console.error('Error with selector:', selector, e);
-                return false;
-            }
-            
-            if (element) {
-                element.classList.add('highlight');
-                element.scrollIntoView({ behavior: 'smooth', block: 'center' });
-                
-                // Add debug info to element
-                console.log('Highlighted element:', element);
-                console.log('Element parent:', element.parentElement);
-                console.log('Element context:', {
-                    id: element.id,
-                    className: element.className,
-                    tagName: element.tagName,
-                    type: element.type,
-                    textContent: element.textContent?.trim(),
-                    parentId: element.parentElement?.id,
-                    parentClass: element.parentElement?.className
-                });
-                
-                return true;
-            } else {
-                console.error('No element found for selector:', selector);
-                return false;
-            }
-        }
-        
-        // Expose function globally for demo purposes
-        window.highlightElement = highlightElement;
-    </script>
-</body>
-</html>
+def _load_sample_html() -> str:
+    """Read the sample page that sits next to this script"""
+    return (Path(__file__).parent / 'sample.html').read_text(encoding='utf-8')
+
+# Table row selector for each user in the sample page (row 1 is the header)
+_USER_ROW_SELECTORS = {
+    "John Doe": "#user-table tr:nth-of-type(2)",
+    "Jane Smith": "#user-table tr:nth-of-type(3)",
+    "Bob Johnson": "#user-table tr:nth-of-type(4)"
+}
+
+# Lookup results for the current mapping snapshot, emptied whenever the executor refreshes its mapping
+_lookup_cache: dict[tuple, dict | None] = {}
+_lookup_snapshot: tuple[int, int] | None = None
+
+def _current_lookup_cache(executor) -> dict[tuple, dict | None]:
+    """Return the lookup cache, clearing it first if the mapping changed since it was filled"""
+    global _lookup_snapshot
+    snapshot = (id(executor), executor.mapping_version)
+    if snapshot != _lookup_snapshot:
+        _lookup_cache.clear()
+        _lookup_snapshot = snapshot
+    return _lookup_cache
+
+async def find_with_context(executor, text: str, context_hints: list[str] | None = None):
+    """Cached wrapper around executor.find_element_with_context"""
+    hints = tuple(context_hints or ())
+    cache = _current_lookup_cache(executor)
+    key = ('context', text, hints)
+    if key not in cache:
+        cache[key] = await executor.find_element_with_context(text, list(hints) or None)
+    return cache[key]
+
+async def find_in_container(executor, text: str, container_selector: str = None, container_text: str = None):
+    """Cached wrapper around executor.find_element_in_container"""
+    cache = _current_lookup_cache(executor)
+    key = ('container', text, container_selector, container_text)
+    if key not in cache:
+        cache[key] = await executor.find_element_in_container(
+            text, container_selector=container_selector, container_text=container_text
+        )
+    return cache[key]
+
+async def ainput(prompt: str = "") -> str:
+    """input() on a daemon thread so the event loop keeps running while we wait and Ctrl-C can still exit"""
+    return await run_in_daemon_thread(input, prompt, name='demo-input')
+
+# Summary of a selector's matches, read in the same call that resolves them
+_PROBE_JS = """
+    (elements) => ({ count: elements.length, tag: elements[0]?.tagName, text: elements[0]?.textContent?.trim() })
 """
 
+async def bulk_probe(page, selectors: list[str]) -> list[dict]:
+    """Check many selectors concurrently through Playwright's selector engine, as highlight_element resolves them"""
+    async def probe(selector: str) -> dict:
+        try:
+            return await page.locator(selector).evaluate_all(_PROBE_JS)
+        except Exception as err:
+            return {"count": 0, "error": str(err)}
+
+    return await asyncio.gather(*(probe(selector) for selector in selectors))
+
 async def highlight_element(page, selector: str, description: str, element_info: dict):
     """Highlight an element on the page with enhanced debugging"""
     try:
         print(f"🎯 Attempting to highlight: {description}")
         print(f"   Using selector: {selector}")
         
-        # First check if the selector matches any elements
-        element_count = await page.evaluate(f"""
-            document.querySelectorAll('{selector}').length
-        """)
+        # Count and highlight in a single round-trip through Playwright's selector engine
+        result = await page.locator(selector).evaluate_all("""
+            (elements, sel) => {
+                if (!elements.length) return { count: 0 };
+                if (elements[0] === window.__lastHighlight) return { count: elements.length, skipped: true };
+
+                // Read the position before mutating anything so it doesn't force a relayout
+                const el = elements[0];
+                const rect = el.getBoundingClientRect();
+                const inView = rect.top >= 0 && rect.bottom <= window.innerHeight;
+
+                // Remove the previous highlight
+                if (window.__lastHighlight) window.__lastHighlight.classList.remove('demo-highlight');
+
+                // Highlight the first matching element
+                el.classList.add('demo-highlight');
+                window.__lastHighlight = el;
+
+                // Scroll into view only if it isn't visible already
+                if (!inView) el.scrollIntoView({ behavior: 'smooth', block: 'center' });
+
+                // Set window.__DEMO_VERBOSE = false in the console to silence this
+                if (window.__DEMO_VERBOSE !== false) {
+                    console.log('[demo]', { sel, id: el.id, class: el.className, tag: el.tagName, text: el.textContent?.trim()?.slice(0, 40) });
+                }
+                return { count: elements.length };
+            }
+        """, selector)
         
+        element_count = result['count']
         if element_count == 0:
             print(f"   ❌ Selector matches no elements")
             return False
@@ -302,33 +140,10 @@ async def highlight_element(page, selector: str, description: str, element_info:
         else:
             print(f"   ✅ Selector matches exactly 1 element")
         
-        # Try to highlight the element
-        await page.evaluate(f"""
-            const elements = document.querySelectorAll('{selector}');
-            if (elements.length > 0) {{
-                // Remove any existing highlights
-                document.querySelectorAll('.demo-highlight').forEach(el => {{
-                    el.classList.remove('demo-highlight');
-                    el.style.border = '';
-                    el.style.backgroundColor = '';
-                }});
-                
-                // Highlight the first matching element
-                const el = elements[0];
-                el.classList.add('demo-highlight');
-                el.style.border = '3px solid #ff6b6b';
-                el.style.backgroundColor = 'rgba(255, 107, 107, 0.1)';
-                
-                // Scroll into view
-                el.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-                
-                console.log('Highlighted element:', el);
-                console.log('Element text:', el.textContent.trim());
-                console.log('Element tag:', el.tagName);
-                console.log('Element classes:', el.className);
-            }}
-        """)
-        
+        if result.get('skipped'):
+            print(f"   ✅ Already highlighted: {description}")
+            return True
+
         print(f"   ✅ Successfully highlighted: {description}")
         return True
         
@@ -348,7 +163,7 @@ async def demonstrate_interactive_selection():
 
     # Load the sample HTML
     page = await browser.get_current_page()
-    await page.set_content(SAMPLE_HTML)
+    await page.set_content(_load_sample_html())
     await page.wait_for_load_state()
 
     # Create semantic executor
@@ -392,7 +207,9 @@ async def demonstrate_interactive_selection():
     # Show all available elements with their hierarchical context
     mapping = await executor.list_available_elements_with_context()
 
-    input("\n⏸️  Press Enter to see element selection examples...")
+    # Re-extract the mapping while the user reads the listing
+    refresh = asyncio.create_task(executor._refresh_semantic_mapping())
+    await ainput("\n⏸️  Press Enter to see element selection examples...")
 
     print("\n" + "="*80)
     print("🎯 INTERACTIVE ELEMENT SELECTION EXAMPLES")
@@ -400,20 +217,50 @@ async def demonstrate_interactive_selection():
 
     # Example 1: Show all Submit buttons with context
     print("\n1️⃣ Finding all Submit buttons:")
-    await executor._refresh_semantic_mapping()
-    submit_buttons = []
-    for text, info in executor.current_mapping.items():
-        if 'submit' in text.lower():
-            submit_buttons.append((text, info['selectors']))
-
-    for i, (text, selector) in enumerate(submit_buttons):
-        print(f"   Submit #{i+1}: '{text}' -> {selector}")
+    await refresh
+
+    # Collect the Submit and Edit entries in one pass over the executor's cached lowercase keys
+    submit_buttons, edit_buttons_info = [], []
+    for text, text_lower in executor._lower_keys.items():
+        if 'submit' in text_lower:
+            submit_buttons.append((text, executor.current_mapping[text]))
+        if 'edit' in text_lower:
+            edit_buttons_info.append((text, executor.current_mapping[text]))
+
+    for i, (text, info) in enumerate(submit_buttons):
+        print(f"   Submit #{i+1}: '{text}' -> {info['selectors']}")
+
+    # Resolve every element the walkthrough will highlight and validate them all at once;
+    # the lookups are cached, so the steps below reuse these results
+    print("\n   🔎 Pre-validating the selectors used in this demo:")
+    planned = [
+        ("Personal Submit", await find_with_context(executor, "Submit", ["personal"])),
+        ("Billing Submit", await find_with_context(executor, "Submit", ["billing"])),
+    ]
+    row_edits = await asyncio.gather(*(
+        find_in_container(executor, "Edit", container_selector=row_selector)
+        for row_selector in _USER_ROW_SELECTORS.values()
+    ))
+    planned += [(f"Edit for {user_name}", edit) for user_name, edit in zip(_USER_ROW_SELECTORS, row_edits)]
+    planned.append((
+        "Delete for John Doe",
+        await find_in_container(executor, "Delete", container_selector=_USER_ROW_SELECTORS["John Doe"]),
+    ))
+    planned += [
+        ("Personal First Name", await find_with_context(executor, "First Name", ["personal"])),
+        ("Billing First Name", await find_with_context(executor, "First Name", ["billing"])),
+        ("Weekly radio", await find_with_context(executor, "Weekly", ["newsletter"])),
+    ]
+    planned = [(label, element) for label, element in planned if element and element.get('selectors')]
+    probes = await bulk_probe(page, [element['selectors'] for _, element in planned])
+    for (label, element), probe in zip(planned, probes):
+        print(f"      {label}: {element['selectors']} -> {probe['count']} match(es)")
 
-    input("\n⏸️  Press Enter to highlight the Personal Information Submit button...")
+    await ainput("\n⏸️  Press Enter to highlight the Personal Information Submit button...")
 
     # Example 2: Highlight specific Submit button
     print("\n2️⃣ Contextual Selection - Personal Information Submit:")
-    personal_submit = await executor.find_element_with_context("Submit", ["personal"])
+    personal_submit = await find_with_context(executor, "Submit", ["personal"])
     if personal_submit:
         selector = personal_submit['selectors']
         success = await highlight_element(page, selector, "Personal Submit button", personal_submit)
@@ -425,11 +272,11 @@ async def demonstrate_interactive_selection():
             "Personal Information", success
         )
 
-    input("\n⏸️  Press Enter to highlight the Billing Information Submit button...")
+    await ainput("\n⏸️  Press Enter to highlight the Billing Information Submit button...")
 
     # Example 3: Highlight billing submit
     print("\n3️⃣ Contextual Selection - Billing Information Submit:")
-    billing_submit = await executor.find_element_with_context("Submit", ["billing"])
+    billing_submit = await find_with_context(executor, "Submit", ["billing"])
     if billing_submit:
         selector = billing_submit['selectors']
         success = await highlight_element(page, selector, "Billing Submit button", billing_submit)
@@ -441,18 +288,12 @@ async def demonstrate_interactive_selection():
             "Billing Information", success
         )
 
-    input("\n⏸️  Press Enter to see table row selection...")
+    await ainput("\n⏸️  Press Enter to see table row selection...")
 
     # Example 4: Table row selection with comprehensive recording
     print("\n4️⃣ Table Row Selection - Edit buttons:")
 
     # First, let's see what selectors are actually generated for Edit buttons
-    await executor._refresh_semantic_mapping()
-    edit_buttons_info = []
-    for text, info in executor.current_mapping.items():
-        if 'edit' in text.lower():
-            edit_buttons_info.append((text, info))
-
     print("   📋 Available Edit buttons found:")
     for text, info in edit_buttons_info:
         print(f"      '{text}' -> {info['selectors']}")
@@ -462,19 +303,16 @@ async def demonstrate_interactive_selection():
     # NEW APPROACH: Find Edit buttons by first finding their table rows
     print("\n   🎯 Using hierarchical container approach:")
 
-    # Define the users and their row positions
-    users = [
-        ("John Doe", 2),    # First data row (after header)
-        ("Jane Smith", 3),  # Second data row
-        ("Bob Johnson", 4)  # Third data row
-    ]
+    users = list(_USER_ROW_SELECTORS.items())
 
-    for i, (user_name, row_num) in enumerate(users, 1):
-        print(f"\n   Finding Edit button for {user_name} (row {row_num})...")
+    # Method 1: Find by row selector - the rows are independent, so look them all up at once
+    edit_buttons = await asyncio.gather(*(
+        find_in_container(executor, "Edit", container_selector=row_selector)
+        for _, row_selector in users
+    ))
 
-        # Method 1: Find by row selector
-        row_selector = f"#user-table tr:nth-of-type({row_num})"
-        edit_button = await executor.find_element_in_container("Edit", container_selector=row_selector)
+    for i, ((user_name, row_selector), edit_button) in enumerate(zip(users, edit_buttons), 1):
+        print(f"\n   Finding Edit button for {user_name} ({row_selector})...")
 
         if edit_button:
             print(f"   ✅ Found Edit button using row selector: {edit_button['selectors']}")
@@ -489,7 +327,7 @@ async def demonstrate_interactive_selection():
             if not success:
                 print(f"   ⚠️  Row selector highlighting failed, trying alternative...")
                 # Method 2: Find by user name in the row
-                alt_edit_button = await executor.find_element_in_container("Edit", container_text=user_name)
+                alt_edit_button = await find_in_container(executor, "Edit", container_text=user_name)
                 if alt_edit_button:
                     print(f"   ✅ Found Edit button using user name: {alt_edit_button['selectors']}")
                     success = await highlight_element(page, alt_edit_button['selectors'], f"Edit button for {user_name} (by name)", alt_edit_button)
@@ -502,7 +340,7 @@ async def demonstrate_interactive_selection():
         else:
             print(f"   ❌ Could not find Edit button for {user_name}")
             # Try the alternative approach
-            alt_edit_button = await executor.find_element_in_container("Edit", container_text=user_name)
+            alt_edit_button = await find_in_container(executor, "Edit", container_text=user_name)
             if alt_edit_button:
                 print(f"   💡 Found using user name approach: {alt_edit_button['selectors']}")
                 success = await highlight_element(page, alt_edit_button['selectors'], f"Edit button for {user_name} (by name)", alt_edit_button)
@@ -520,18 +358,17 @@ async def demonstrate_interactive_selection():
                 )
 
         if i < len(users):  # Don't pause after the last one
-            input(f"     ⏸️  Press Enter to find Edit button for {users[i][0]}...")
+            await ainput(f"     ⏸️  Press Enter to find Edit button for {users[i][0]}...")
 
     # Also demonstrate Delete buttons
     print(f"\n   🗑️  Now finding Delete buttons in the same rows...")
 
-    for i, (user_name, row_num) in enumerate(users, 1):
+    for i, (user_name, row_selector) in enumerate(users, 1):
         if i > 1:  # Skip first one to save time
             break
 
         print(f"\n   Finding Delete button for {user_name}...")
-        row_selector = f"#user-table tr:nth-of-type({row_num})"
-        delete_button = await executor.find_element_in_container("Delete", container_selector=row_selector)
+        delete_button = await find_in_container(executor, "Delete", container_selector=row_selector)
 
         if delete_button:
             print(f"   ✅ Found Delete button: {delete_button['selectors']}")
@@ -549,13 +386,13 @@ async def demonstrate_interactive_selection():
                 f"Failed for {user_name}", False
             )
 
-    input("\n⏸️  Press Enter to test form field disambiguation...")
+    await ainput("\n⏸️  Press Enter to test form field disambiguation...")
 
     # Example 5: Form field disambiguation
     print("\n5️⃣ Form Field Disambiguation:")
 
     # Personal first name
-    personal_firstName = await executor.find_element_with_context("First Name", ["personal"])
+    personal_firstName = await find_with_context(executor, "First Name", ["personal"])
     if personal_firstName:
         selector = personal_firstName['selectors']
         success = await highlight_element(page, selector, "Personal First Name field", personal_firstName)
@@ -567,10 +404,10 @@ async def demonstrate_interactive_selection():
             "Personal Information", success
         )
 
-    input("     ⏸️  Press Enter to highlight Billing First Name...")
+    await ainput("     ⏸️  Press Enter to highlight Billing First Name...")
 
     # Billing first name
-    billing_firstName = await executor.find_element_with_context("First Name", ["billing"])
+    billing_firstName = await find_with_context(executor, "First Name", ["billing"])
     if billing_firstName:
         selector = billing_firstName['selectors']
         success = await highlight_element(page, selector, "Billing First Name field", billing_firstName)
@@ -582,11 +419,11 @@ async def demonstrate_interactive_selection():
             "Billing Information", success
         )
 
-    input("\n⏸️  Press Enter to see radio button selection...")
+    await ainput("\n⏸️  Press Enter to see radio button selection...")
 
     # Example 6: Radio button selection
     print("\n6️⃣ Radio Button Selection:")
-    weekly_radio = await executor.find_element_with_context("Weekly", ["newsletter"])
+    weekly_radio = await find_with_context(executor, "Weekly", ["newsletter"])
     if weekly_radio:
         selector = weekly_radio['selectors']
         success = await highlight_element(page, selector, "Weekly radio button", weekly_radio)
@@ -621,7 +458,7 @@ async def demonstrate_interactive_selection():
     print("💡 WHAT YOU'RE SEEING")
     print("="*80)
     print("""
-    🎯 Visual Highlighting: Each selected element is highlighted with a red border and animation
+    🎯 Visual Highlighting: Each selected element is highlighted with a red border and glow
     📍 Precise Selection: Even with repeated text like "Submit" and "Edit", the system finds the exact element
     🔄 Hierarchical Context: Elements get context like "(in Personal Information)" or "(item 2 of 3)"
     🛡️  Fallback Selectors: Multiple selector strategies ensure reliability
@@ -639,7 +476,7 @@ async def demonstrate_interactive_selection():
 
     # Show detailed selector information for a complex element
     print("\nDetailed selector hierarchy for table Edit button:")
-    edit_element = await executor.find_element_with_context("Edit", ["item 2"])
+    edit_element = await find_with_context(executor, "Edit", ["item 2"])
     if edit_element:
         print(f"  Element text: 'Edit (item 2 of 3)'")
         print(f"  Primary selector: {edit_element.get('selectors', 'N/A')}")
@@ -676,13 +513,29 @@ async def demonstrate_interactive_selection():
     print("   • Code examples for each interaction method")
     print("   • Element categorization and success rates")
 
-    input("\n⏸️  Press Enter when you're done inspecting the browser...")
+    await ainput("\n⏸️  Press Enter when you're done inspecting the browser...")
 
     print("\n👋 Closing browser...")
     await browser.close()
     
     return output_file
 
+# Usage snippets per interaction method, filled in with the element text and context
+_USAGE_TEMPLATES = {
+    "hierarchical_container": (
+        'await executor.find_element_in_container("{text}", container_selector="...")',
+        'await executor.find_element_in_container("{text}", container_text="...")'
+    ),
+    "context_hints": (
+        'await executor.find_element_with_context("{text}", ["{context}"])',
+        'await executor.find_element_with_context("{text}", ["section", "{context}"])'
+    ),
+    "direct_semantic": (
+        'await executor.find_element_with_context("{text}")',
+        'element = mapping["{text}"]  # Direct mapping access'
+    )
+}
+
 def record_interaction_example(element_type: str, element_text: str, interaction_method: str, 
                               selector_info: dict, context: str = "", success: bool = True):
     """Record an interaction example for the output mapping"""
@@ -698,25 +551,11 @@ def record_interaction_example(element_type: str, element_text: str, interaction
             "fallback": selector_info.get('fallback_selector', ''),
             "xpath": selector_info.get('text_xpath', '')
         },
-        "usage_examples": []
-    }
-    
-    # Add usage examples based on interaction method
-    if interaction_method == "hierarchical_container":
-        example["usage_examples"] = [
-            f'await executor.find_element_in_container("{element_text}", container_selector="...")',
-            f'await executor.find_element_in_container("{element_text}", container_text="...")'
-        ]
-    elif interaction_method == "context_hints":
-        example["usage_examples"] = [
-            f'await executor.find_element_with_context("{element_text}", ["{context.lower()}"])',
-            f'await executor.find_element_with_context("{element_text}", ["section", "{context.lower()}"])'
-        ]
-    elif interaction_method == "direct_semantic":
-        example["usage_examples"] = [
-            f'await executor.find_element_with_context("{element_text}")',
-            f'element = mapping["{element_text}"]  # Direct mapping access'
+        "usage_examples": [
+            template.format(text=element_text, context=context.lower())
+            for template in _USAGE_TEMPLATES.get(interaction_method, ())
         ]
+    }
     
     interaction_mapping["interaction_examples"].append(example)
     
@@ -764,8 +603,8 @@ def generate_interaction_mapping_output():
     
     # Save to file
     output_file = "hierarchical_selection_interaction_mapping.json"
-    with open(output_file, 'w') as f:
-        json.dump(interaction_mapping, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(json_dumps(interaction_mapping, indent=True, default=str))
     
     return output_file
 
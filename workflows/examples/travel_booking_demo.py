@@ -1,42 +1,173 @@
 import asyncio
 import logging
+import time
 from browser_use import Browser
+from workflow_use.json_utils import json_dumps
 from workflow_use.workflow.semantic_executor import SemanticWorkflowExecutor
-import json
+from collections import deque
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
+from itertools import islice
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Substrings that mark a mapping entry as flight-related in the selection fallback
+_FLIGHT_KEYWORDS = ('flight', 'book', 'choose', 'view')
+
+# Context hints for the search form lookups
+_DEPARTURE_CONTEXT = ("departure", "origin")
+_DESTINATION_CONTEXT = ("destination", "arrival")
+_DEPART_DATE_CONTEXT = ("date", "departure")
+_TRAVELERS_CONTEXT = ("passengers", "cabin")
+_SEARCH_CONTEXT = ("flights", "search")
+
+# Fallback selectors for the departure date button, raced as one union locator
+_DEPART_BTN_SELECTORS = (
+    'button[data-testid="depart-btn"]',
+    '[data-testid="depart-btn"]',
+    'button:has-text("Depart")',
+    'button:has-text("Add date")',
+    '.depart-date',
+    '#depart-date'
+)
+_DEPART_BTN_UNION = ", ".join(_DEPART_BTN_SELECTORS)
+
+# Calendar containers (raced as one union) and the buttons that reopen a closed calendar, in order
+_CALENDAR_CONTAINER_UNION = ", ".join((
+    '[role="dialog"]',
+    '.calendar',
+    '.datepicker',
+    '[data-testid*="calendar"]',
+    '[data-testid*="datepicker"]'
+))
+_DATE_BUTTON_SELECTORS = (
+    'button[data-testid="depart-btn"]',
+    'button[data-testid="return-btn"]',
+    'button:has-text("Depart")',
+    'button:has-text("Return")'
+)
+
+# Element that marks the search form as ready
+_SEARCH_FORM_READY_SELECTOR = 'input[name="from"], [data-testid="depart-btn"]'
+
+# Reports whether the DOM changed since the previous call and re-arms a MutationObserver.
+# The flag is reset before the mapping is rebuilt, so mutations during extraction count as changes.
+_DOM_CHANGED_JS = """
+() => {
+    const changed = window.__domDirty !== false;
+    if (!window.__domObserver) {
+        window.__domObserver = new MutationObserver(() => { window.__domDirty = true; });
+        window.__domObserver.observe(document.documentElement, { subtree: true, childList: true, attributes: true });
+    }
+    window.__domDirty = false;
+    return changed;
+}
+"""
+
+# Calendar day selectors tried by the date fallback, filled in per date. They go from exact to
+# loose and must be tried one at a time in this order: a union would click whichever match
+# comes first in the DOM, letting a loose selector pick the wrong day.
+_DAY_SELECTORS = (
+    # Skyscanner specific
+    '[data-testid*="day-{day}"]',
+    '[data-testid*="date-{day}"]',
+    'button[aria-label*="{month_name} {day}"]',
+    'button[aria-label*="{month_short} {day}"]',
+    '[data-date="{date_value}"]',
+    '[data-date*="{day_pad}"]',
+    # Generic calendar selectors
+    '[role="gridcell"]:has-text("{day}")',
+    '[role="gridcell"][aria-label*="{day}"]',
+    '.calendar-day:has-text("{day}")',
+    '.day:has-text("{day}")',
+    'button:has-text("{day}")',
+    'td:has-text("{day}")',
+    '[aria-label*="{month_name} {day_pad}"]',
+    '[aria-label*="{month_short} {day_pad}"]',
+    '[title*="{month_name} {day_pad}"]'
+)
+
+# One browser shared by every demo in this process; each demo works in its own tab
+_shared_browser: Browser | None = None
+
+async def get_browser() -> Browser:
+    """Start the shared browser on first use and return it."""
+    global _shared_browser
+    if _shared_browser is None:
+        _shared_browser = Browser()
+        await _shared_browser.start()
+    return _shared_browser
+
+async def close_shared_browser():
+    """Close the shared browser if one was started."""
+    global _shared_browser
+    if _shared_browser is not None:
+        await _shared_browser.close()
+        _shared_browser = None
+
+# Oldest interactions are dropped once the log holds this many
+MAX_INTERACTION_LOG = 10_000
+
+@dataclass(slots=True)
+class Interaction:
+    """One logged demo interaction; timestamp is epoch seconds, formatted when the report is written."""
+    timestamp: float
+    action: str
+    element: str
+    success: bool
+    details: str
+
 class TravelBookingDemo:
     """Demo for complex travel booking UI interactions like Skyscanner."""
     
     def __init__(self):
         self.browser = None
+        self.page = None
         self.executor = None
-        self.interaction_log = []
+        self.interaction_log: deque[Interaction] = deque(maxlen=MAX_INTERACTION_LOG)
+        # Caps how many executor lookups run at once when they are gathered
+        self.lookup_limit = asyncio.Semaphore(4)
+        # find_element_with_context results for the current mapping snapshot
+        self._lookup_cache = {}
+        self._lookup_version = None
     
     async def setup(self):
-        """Initialize browser and executor."""
-        self.browser = Browser()
-        await self.browser.start()
+        """Open a tab on the shared browser and create the executor."""
+        self.browser = await get_browser()
+        self.page = await self.browser.create_new_tab()
         self.executor = SemanticWorkflowExecutor(self.browser)
     
     async def cleanup(self):
-        """Clean up resources."""
-        if self.browser:
-            await self.browser.close()
+        """Close this demo's tab; the shared browser stays up for other demos."""
+        if self.page and not self.page.is_closed():
+            await self.page.close()
     
     def log_interaction(self, action: str, element: str, success: bool, details: str = ""):
         """Log interaction for analysis."""
-        self.interaction_log.append({
-            "timestamp": datetime.now().isoformat(),
-            "action": action,
-            "element": element,
-            "success": success,
-            "details": details
-        })
+        self.interaction_log.append(Interaction(time.time(), action, element, success, details))
+    
+    async def _find(self, target_text: str, context_hints: tuple):
+        """find_element_with_context, bounded by the lookup semaphore and cached per mapping snapshot."""
+        if self._lookup_version != self.executor.mapping_version:
+            self._lookup_cache.clear()
+            self._lookup_version = self.executor.mapping_version
+        key = (target_text, context_hints)
+        if key not in self._lookup_cache:
+            async with self.lookup_limit:
+                self._lookup_cache[key] = await self.executor.find_element_with_context(target_text, list(context_hints))
+        return self._lookup_cache[key]
+    
+    async def _refresh_mapping_if_changed(self, page):
+        """Refresh the executor's semantic mapping unless the DOM is unchanged since the last refresh."""
+        # Returns false only while the observer installed below is live and has seen no mutations;
+        # a navigation replaces window, so the next check reports the page as changed
+        changed = await page.evaluate(_DOM_CHANGED_JS)
+        if not changed and self.executor.current_mapping:
+            logger.info("DOM unchanged since last refresh, reusing semantic mapping")
+            return
+        await self.executor._refresh_semantic_mapping()
     
     async def demo_skyscanner_booking(self):
         """Demonstrate complex booking flow on Skyscanner."""
@@ -46,15 +177,29 @@ class TravelBookingDemo:
         page = await self.browser.get_current_page()
         
         try:
-            # Navigate to Skyscanner
-            await page.goto("https://www.skyscanner.com", timeout=30000)
-            await page.wait_for_load_state('networkidle')
+            # Navigate to Skyscanner and wait only for the search form, not for network idle
+            await page.goto("https://www.skyscanner.com", wait_until='domcontentloaded', timeout=30000)
+            try:
+                await page.locator(_SEARCH_FORM_READY_SELECTOR).first.wait_for(timeout=10000)
+            except Exception:
+                logger.debug("Search form marker not found, continuing with the loaded DOM")
             
             print("✅ Loaded Skyscanner homepage")
             
+            # Extract the mapping once so the gathered lookups below all read the same snapshot
+            # instead of each starting its own extraction on the shared extractor
+            await self.executor._refresh_semantic_mapping()
+            
+            # The search form fields are independent lookups against the same page, so resolve them together
+            departure_input, destination_input, date_field, travelers_button = await asyncio.gather(
+                self._find("From", _DEPARTURE_CONTEXT),
+                self._find("To", _DESTINATION_CONTEXT),
+                self._find("Depart", _DEPART_DATE_CONTEXT),
+                self._find("Travelers", _TRAVELERS_CONTEXT)
+            )
+            
             # Step 1: Handle departure city input
             print("\n1️⃣ Setting departure city...")
-            departure_input = await self.executor.find_element_with_context("From", ["departure", "origin"])
             if departure_input:
                 await self._interact_with_element(page, departure_input, "click")
                 await page.fill(departure_input['selectors'], "San Francisco")
@@ -67,7 +212,6 @@ class TravelBookingDemo:
             
             # Step 2: Handle destination city input
             print("\n2️⃣ Setting destination city...")
-            destination_input = await self.executor.find_element_with_context("To", ["destination", "arrival"])
             if destination_input:
                 await self._interact_with_element(page, destination_input, "click")
                 await page.fill(destination_input['selectors'], "New York")
@@ -80,29 +224,21 @@ class TravelBookingDemo:
             
             # Step 3: Handle departure date selection
             print("\n3️⃣ Selecting departure date...")
-            departure_date = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+            now = datetime.now()
+            departure_dt = now + timedelta(days=30)
+            return_dt = now + timedelta(days=37)
+            departure_date = departure_dt.strftime('%Y-%m-%d')
+            return_date = return_dt.strftime('%Y-%m-%d')
             
             # First click the departure date field to open calendar
-            date_field = await self.executor.find_element_with_context("Depart", ["date", "departure"])
             if not date_field:
-                # Try alternative selectors for departure date button
-                alternative_selectors = [
-                    'button[data-testid="depart-btn"]',
-                    '[data-testid="depart-btn"]',
-                    'button:has-text("Depart")',
-                    'button:has-text("Add date")',
-                    '.depart-date',
-                    '#depart-date'
-                ]
-                
-                for selector in alternative_selectors:
-                    try:
-                        await page.click(selector, timeout=2000)
-                        date_field = {"found": True, "selector": selector}
-                        print(f"✅ Clicked departure button with: {selector}")
-                        break
-                    except:
-                        continue
+                # Try alternative selectors for departure date button, raced in one locator
+                try:
+                    await page.locator(_DEPART_BTN_UNION).first.click(timeout=3000)
+                    date_field = {"found": True, "selector": _DEPART_BTN_UNION}
+                    print(f"✅ Clicked departure button with: {_DEPART_BTN_UNION}")
+                except:
+                    pass
             
             if date_field:
                 if not date_field.get("found"):
@@ -111,7 +247,7 @@ class TravelBookingDemo:
                 await asyncio.sleep(3)  # Wait for calendar to load
                 
                 # Refresh semantic mapping to detect calendar elements
-                await self.executor._refresh_semantic_mapping()
+                await self._refresh_mapping_if_changed(page)
                 
                 # Now try to select the specific date
                 calendar_date = await self.executor.select_calendar_date(departure_date, "departure")
@@ -122,13 +258,12 @@ class TravelBookingDemo:
                 else:
                     print(f"❌ Could not find departure date: {departure_date}")
                     # Try fallback approach
-                    await self._try_calendar_fallback(page, departure_date, "departure")
+                    await self._try_calendar_fallback(page, departure_dt, "departure")
             
             # Step 4: Handle return date selection
             print("\n4️⃣ Selecting return date...")
-            return_date = (datetime.now() + timedelta(days=37)).strftime('%Y-%m-%d')
             
-            # Try to select return date
+            # Looked up only after the departure click, which usually re-renders the calendar
             calendar_date = await self.executor.select_calendar_date(return_date, "return")
             if calendar_date:
                 await self._interact_with_element(page, calendar_date, "click")
@@ -136,11 +271,10 @@ class TravelBookingDemo:
                 print(f"✅ Selected return date: {return_date}")
             else:
                 print(f"❌ Could not find return date: {return_date}")
-                await self._try_calendar_fallback(page, return_date, "return")
+                await self._try_calendar_fallback(page, return_dt, "return")
             
             # Step 5: Handle travelers and cabin class
             print("\n5️⃣ Setting travelers and cabin class...")
-            travelers_button = await self.executor.find_element_with_context("Travelers", ["passengers", "cabin"])
             if travelers_button:
                 await self._interact_with_element(page, travelers_button, "click")
                 await asyncio.sleep(1)
@@ -154,7 +288,7 @@ class TravelBookingDemo:
             
             # Step 6: Search for flights
             print("\n6️⃣ Searching for flights...")
-            search_button = await self.executor.find_element_with_context("Search", ["flights", "search"])
+            search_button = await self._find("Search", _SEARCH_CONTEXT)
             if search_button:
                 await self._interact_with_element(page, search_button, "click")
                 
@@ -188,7 +322,7 @@ class TravelBookingDemo:
         await asyncio.sleep(3)
         
         # Refresh semantic mapping to get flight results
-        await self.executor._refresh_semantic_mapping()
+        await self._refresh_mapping_if_changed(page)
         
         # Try to find and select a flight based on criteria
         flight_criteria = {
@@ -204,65 +338,71 @@ class TravelBookingDemo:
             print(f"✅ Selected flight based on criteria: {flight_criteria}")
         else:
             # Fallback: try to find any "Select" button or other flight-related elements
-            select_buttons = []
-            flight_elements = []
+            # Only the first match of each kind is used, and a select button beats any
+            # flight element, so stop scanning as soon as one is found
+            select_button = None
+            flight_element = None
             
             # Look for various flight selection patterns
             for text, element_info in self.executor.current_mapping.items():
                 text_lower = text.lower()
-                element_type = element_info.get('element_type', '')
                 
                 # Look for select buttons
-                if 'select' in text_lower and 'button' in element_type:
-                    select_buttons.append((text, element_info))
+                if 'select' in text_lower and 'button' in element_info.get('element_type', ''):
+                    select_button = (text, element_info)
+                    break
                 
                 # Look for flight-related elements
-                if any(keyword in text_lower for keyword in ['flight', 'book', 'choose', 'view']):
-                    flight_elements.append((text, element_info))
+                if flight_element is None and any(keyword in text_lower for keyword in _FLIGHT_KEYWORDS):
+                    flight_element = (text, element_info)
             
-            if select_buttons:
+            if select_button:
                 # Select the first available flight
-                first_flight = select_buttons[0][1]
+                first_flight = select_button[1]
                 await self._interact_with_element(page, first_flight, "click")
                 self.log_interaction("selection", "flight_option", True, "First available")
                 print("✅ Selected first available flight")
-            elif flight_elements:
+            elif flight_element:
                 # Try flight-related elements
-                first_flight = flight_elements[0][1]
+                first_flight = flight_element[1]
                 await self._interact_with_element(page, first_flight, "click")
                 self.log_interaction("selection", "flight_option", True, "Flight element")
-                print(f"✅ Clicked flight element: {flight_elements[0][0]}")
+                print(f"✅ Clicked flight element: {flight_element[0]}")
             else:
                 print("❌ Could not find any flight selection options")
                 # Debug: show what elements are available
                 print("   🔍 Available elements:")
-                count = 0
-                for text, element_info in self.executor.current_mapping.items():
-                    if count < 10:  # Show first 10 elements
-                        print(f"      - {text} ({element_info.get('element_type', 'unknown')})")
-                        count += 1
-                    else:
-                        print(f"      ... and {len(self.executor.current_mapping) - 10} more")
-                        break
+                for text, element_info in islice(self.executor.current_mapping.items(), 10):  # Show first 10 elements
+                    print(f"      - {text} ({element_info.get('element_type', 'unknown')})")
+                if len(self.executor.current_mapping) > 10:
+                    print(f"      ... and {len(self.executor.current_mapping) - 10} more")
     
     async def _interact_with_element(self, page, element_info: dict, action: str):
         """Safely interact with an element using multiple fallback strategies."""
         selectors = [
-            element_info.get('selectors'),
-            element_info.get('hierarchical_selector'),
-            element_info.get('fallback_selector')
+            selector for selector in (
+                element_info.get('selectors'),
+                element_info.get('hierarchical_selector'),
+                element_info.get('fallback_selector')
+            ) if selector
         ]
+        if not selectors:
+            logger.warning(f"Could not {action} element: no selectors available")
+            return False
+        
+        # Race all selectors in one locator so the worst case is a single timeout
+        union = ", ".join(dict.fromkeys(selectors))
+        try:
+            await self._perform_action(page.locator(union).first, action, element_info)
+            logger.info(f"Successfully {action}ed element: {union}")
+            return True
+        except Exception as e:
+            logger.debug(f"Failed to {action} {union}: {e}")
         
+        # The union can fail as a whole (e.g. one invalid selector), so fall back to each one
         for selector in selectors:
-            if not selector:
-                continue
-                
             try:
-                if action == "click":
-                    await page.click(selector, timeout=5000)
-                elif action == "fill":
-                    await page.fill(selector, element_info.get('value', ''))
-                
+                await self._perform_action(page.locator(selector).first, action, element_info)
                 logger.info(f"Successfully {action}ed element: {selector}")
                 return True
                 
@@ -273,71 +413,43 @@ class TravelBookingDemo:
         logger.warning(f"Could not {action} element with any selector")
         return False
     
-    async def _try_calendar_fallback(self, page, date_value: str, calendar_type: str):
+    async def _perform_action(self, locator, action: str, element_info: dict):
+        """Run a click or fill against a locator."""
+        if action == "click":
+            await locator.click(timeout=5000)
+        elif action == "fill":
+            await locator.fill(element_info.get('value', ''))
+    
+    async def _try_calendar_fallback(self, page, dt: datetime, calendar_type: str):
         """Try fallback approaches for calendar date selection."""
+        date_value = dt.strftime('%Y-%m-%d')
         print(f"   🔄 Trying fallback calendar selection for {date_value}")
         
         try:
-            # Parse date to get day number
-            from datetime import datetime
-            dt = datetime.strptime(date_value, '%Y-%m-%d')
-            day = dt.strftime('%d').lstrip('0')  # Remove leading zero
-            day_with_zero = dt.strftime('%d')  # Keep leading zero
-            month_name = dt.strftime('%B')
-            month_short = dt.strftime('%b')
-            
-            # Try common calendar day selectors for Skyscanner and other sites
-            day_selectors = [
-                # Skyscanner specific
-                f'[data-testid*="day-{day}"]',
-                f'[data-testid*="date-{day}"]',
-                f'button[aria-label*="{month_name} {day}"]',
-                f'button[aria-label*="{month_short} {day}"]',
-                f'[data-date="{date_value}"]',
-                f'[data-date*="{day_with_zero}"]',
-                
-                # Generic calendar selectors
-                f'[role="gridcell"]:has-text("{day}")',
-                f'[role="gridcell"][aria-label*="{day}"]',
-                f'.calendar-day:has-text("{day}")',
-                f'.day:has-text("{day}")',
-                f'button:has-text("{day}")',
-                f'td:has-text("{day}")',
-                f'[aria-label*="{dt.strftime("%B %d")}"]',
-                f'[aria-label*="{dt.strftime("%b %d")}"]',
-                f'[title*="{dt.strftime("%B %d")}"]'
-            ]
+            fields = {
+                "date_value": date_value,
+                "day": str(dt.day),  # No leading zero
+                "day_pad": f"{dt.day:02d}",  # Keep leading zero
+                "month_name": dt.strftime('%B'),
+                "month_short": dt.strftime('%b')
+            }
+            day_selectors = [template.format(**fields) for template in _DAY_SELECTORS]
             
             # First check if calendar is visible
             calendar_visible = False
-            calendar_selectors = [
-                '[role="dialog"]',
-                '.calendar',
-                '.datepicker',
-                '[data-testid*="calendar"]',
-                '[data-testid*="datepicker"]'
-            ]
             
-            for cal_selector in calendar_selectors:
-                try:
-                    await page.wait_for_selector(cal_selector, timeout=1000)
-                    calendar_visible = True
-                    print(f"   📅 Calendar detected: {cal_selector}")
-                    break
-                except:
-                    continue
+            # A single union locator waits for whichever calendar container appears first
+            try:
+                await page.locator(_CALENDAR_CONTAINER_UNION).first.wait_for(timeout=1000)
+                calendar_visible = True
+                print("   📅 Calendar detected")
+            except:
+                pass
             
             if not calendar_visible:
                 print(f"   ⚠️ No calendar visible, trying to open it first")
                 # Try to click date button again
-                date_buttons = [
-                    'button[data-testid="depart-btn"]',
-                    'button[data-testid="return-btn"]',
-                    'button:has-text("Depart")',
-                    'button:has-text("Return")'
-                ]
-                
-                for btn in date_buttons:
+                for btn in _DATE_BUTTON_SELECTORS:
                     try:
                         await page.click(btn, timeout=1000)
                         await asyncio.sleep(2)
@@ -345,10 +457,14 @@ class TravelBookingDemo:
                     except:
                         continue
             
-            # Try to select the date
+            # Try to select the date in priority order; selectors with no match are skipped
+            # without waiting out the click timeout
             for selector in day_selectors:
+                locator = page.locator(selector)
                 try:
-                    await page.click(selector, timeout=2000)
+                    if await locator.count() == 0:
+                        continue
+                    await locator.first.click(timeout=2000)
                     print(f"   ✅ Fallback success with: {selector}")
                     self.log_interaction("calendar_fallback", f"{calendar_type}_date", True, date_value)
                     return True
@@ -373,29 +489,37 @@ class TravelBookingDemo:
                 "demo_type": "travel_booking"
             },
             "interaction_summary": {},
-            "success_rates": {},
-            "detailed_log": self.interaction_log
+            "success_rates": {}
         }
         
         # Calculate success rates by action type
         action_stats = {}
         for interaction in self.interaction_log:
-            action = interaction['action']
+            action = interaction.action
             if action not in action_stats:
                 action_stats[action] = {"total": 0, "success": 0}
             
             action_stats[action]["total"] += 1
-            if interaction['success']:
+            if interaction.success:
                 action_stats[action]["success"] += 1
         
         for action, stats in action_stats.items():
             success_rate = (stats["success"] / stats["total"]) * 100
             report["success_rates"][action] = f"{success_rate:.1f}%"
         
-        # Save report
-        report_file = f"travel_booking_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Save report; the detailed log is streamed to a sibling NDJSON file one interaction per line
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        report_file = f"travel_booking_report_{stamp}.json"
+        log_file = f"travel_booking_report_{stamp}.ndjson"
+        report["detailed_log_file"] = log_file
+        with open(log_file, 'wb') as f:
+            for interaction in self.interaction_log:
+                row = asdict(interaction)
+                row["timestamp"] = datetime.fromtimestamp(interaction.timestamp).isoformat()
+                f.write(json_dumps(row))
+                f.write(b"\n")
+        with open(report_file, 'wb') as f:
+            f.write(json_dumps(report, indent=True))
         
         return report_file
 
@@ -416,19 +540,22 @@ async def main():
         
         # Generate report
         if demo.interaction_log:
-            report_file = demo.generate_interaction_report()
-            print(f"\n📄 Generated interaction report: {report_file}")
-            
-            # Show summary
-            print("\n📊 Interaction Summary:")
-            action_counts = {}
-            for interaction in demo.interaction_log:
-                action = interaction['action']
-                action_counts[action] = action_counts.get(action, 0) + 1
+            # Write the report on a worker thread while the summary is computed and printed
+            async with asyncio.TaskGroup() as tg:
+                report_task = tg.create_task(asyncio.to_thread(demo.generate_interaction_report))
+                
+                # Show summary
+                print("\n📊 Interaction Summary:")
+                action_counts = {}
+                for interaction in demo.interaction_log:
+                    action = interaction.action
+                    action_counts[action] = action_counts.get(action, 0) + 1
+                
+                for action, count in action_counts.items():
+                    success_count = sum(1 for i in demo.interaction_log if i.action == action and i.success)
+                    print(f"   {action}: {success_count}/{count} successful")
             
-            for action, count in action_counts.items():
-                success_count = sum(1 for i in demo.interaction_log if i['action'] == action and i['success'])
-                print(f"   {action}: {success_count}/{count} successful")
+            print(f"\n📄 Generated interaction report: {report_task.result()}")
         
         if success:
             print("\n✅ Demo completed successfully!")
@@ -445,6 +572,7 @@ async def main():
         traceback.print_exc()
     finally:
         await demo.cleanup()
+        await close_shared_browser()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
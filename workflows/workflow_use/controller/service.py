@@ -219,13 +219,14 @@ class WorkflowController(Controller):
 
 			strip = ['a', 'img']
 
-			content = markdownify.markdownify(await page.content(), strip=strip)
+			parts = [markdownify.markdownify(await page.content(), strip=strip)]
 
 			# manually append iframe text into the content so it's readable by the LLM (includes cross-origin iframes)
 			for iframe in page.frames:
 				if iframe.url != page.url and not iframe.url.startswith('data:'):
-					content += f'\n\nIFRAME {iframe.url}:\n'
-					content += markdownify.markdownify(await iframe.content())
+					parts.append(f'\n\nIFRAME {iframe.url}:\n')
+					parts.append(markdownify.markdownify(await iframe.content()))
+			content = ''.join(parts)
 
 			prompt = 'Your task is to extract the content of the page. You will be given a page and a goal and you should extract all relevant information around this goal from the page. If the goal is vague, summarize the page. Respond in json format. Extraction goal: {goal}, Page: {page}'
 			template = PromptTemplate(input_variables=['goal', 'page'], template=prompt)
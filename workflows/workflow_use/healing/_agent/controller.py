@@ -1,22 +1,136 @@
+import asyncio
+import functools
+import hashlib
 import logging
 import os
+import re
+import weakref
+from collections import OrderedDict
 
 from browser_use import ActionResult, Controller
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
+from langchain_core.messages import HumanMessage, SystemMessage
 from playwright.async_api import Page
-from pydantic import BaseModel, Field, SecretStr
+from pydantic import BaseModel, Field
+
+try:
+	import tiktoken
+except ImportError:  # tiktoken is optional, token counts fall back to a characters-per-token estimate
+	tiktoken = None
+
+try:
+	from selectolax.parser import HTMLParser
+except ImportError:  # selectolax is optional, markdownify is used without it
+	HTMLParser = None
 
 logger = logging.getLogger(__name__)
 
 
-page_extraction_llm = ChatOpenAI(
-	base_url='https://api.groq.com/openai/v1',
-	model='meta-llama/llama-4-scout-17b-16e-instruct',
-	api_key=SecretStr(os.environ['GROQ_API_KEY']),
-	temperature=0.0,
-)
+# Page text sent to the extraction LLM is capped at this many tokens, keeping the head and tail
+MAX_PAGE_CONTENT_TOKENS = 12_000
+_PAGE_CONTENT_HEAD_TOKENS = 8_000
+_PAGE_CONTENT_TAIL_TOKENS = 4_000
+# Used when no tokenizer is available
+_CHARS_PER_TOKEN = 4
+
+# Opt-in: extract only actionable elements with selectolax instead of markdownifying the whole page
+USE_FAST_HTML_TEXT = os.environ.get('HEAL_FAST_HTML_TEXT', '').lower() in ('1', 'true', 'yes')
+
+_ACTIONABLE_SELECTOR = 'h1, h2, h3, h4, h5, h6, form, label, button, input, select, textarea, a[href], [role]'
+_ACTIONABLE_ATTRIBUTES = ('name', 'type', 'placeholder', 'aria-label', 'role', 'value')
+
+# Most recent page analyses kept per controller
+ANALYSIS_CACHE_SIZE = 256
+
+# Bounds how many page analysis requests are in flight to the extraction LLM at once, across all controllers
+DEFAULT_LLM_CONCURRENCY = 4
+# One semaphore per event loop, since an asyncio.Semaphore can't be shared between loops
+_llm_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+
+
+def _llm_concurrency() -> int:
+	"""HEAL_LLM_CONCURRENCY, or the default when it is unset or not a positive integer."""
+	value = os.environ.get('HEAL_LLM_CONCURRENCY')
+	if value is None:
+		return DEFAULT_LLM_CONCURRENCY
+	try:
+		concurrency = int(value)
+	except ValueError:
+		concurrency = 0
+	if concurrency < 1:
+		logger.warning(f'Ignoring HEAL_LLM_CONCURRENCY={value!r}, expected a positive integer; using {DEFAULT_LLM_CONCURRENCY}')
+		return DEFAULT_LLM_CONCURRENCY
+	return concurrency
+
+
+def _llm_semaphore() -> asyncio.Semaphore:
+	"""Return the running loop's analysis semaphore, creating it on first use."""
+	loop = asyncio.get_running_loop()
+	semaphore = _llm_semaphores.get(loop)
+	if semaphore is None:
+		semaphore = _llm_semaphores[loop] = asyncio.Semaphore(_llm_concurrency())
+	return semaphore
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+	"""Return the tokenizer used for the content cap, or None if tiktoken is missing or its BPE file can't be loaded."""
+	if tiktoken is None:
+		return None
+	try:
+		return tiktoken.encoding_for_model('gpt-4o')
+	except Exception as e:
+		logger.debug(f'Falling back to character-based token estimate: {e}')
+		return None
+
+
+def _compact_for_llm(content: str) -> str:
+	"""Collapse redundant whitespace and cap the content at MAX_PAGE_CONTENT_TOKENS."""
+	content = re.sub(r'[ \t]+', ' ', content)
+	content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content).strip()
+	encoding = _get_encoding()
+	if encoding is None:
+		if len(content) > MAX_PAGE_CONTENT_TOKENS * _CHARS_PER_TOKEN:
+			head = content[: _PAGE_CONTENT_HEAD_TOKENS * _CHARS_PER_TOKEN]
+			tail = content[-_PAGE_CONTENT_TAIL_TOKENS * _CHARS_PER_TOKEN :]
+			content = head + '\n…\n' + tail
+		return content
+	tokens = encoding.encode(content, disallowed_special=())
+	if len(tokens) > MAX_PAGE_CONTENT_TOKENS:
+		head = encoding.decode(tokens[:_PAGE_CONTENT_HEAD_TOKENS])
+		tail = encoding.decode(tokens[-_PAGE_CONTENT_TAIL_TOKENS:])
+		content = head + '\n…\n' + tail
+	return content
+
+
+def _html_to_action_text(html: str) -> str:
+	"""Render the actionable elements of an HTML document as one compact line each."""
+	lines = []
+	for node in HTMLParser(html).css(_ACTIONABLE_SELECTOR):
+		attributes = node.attributes
+		details = ' '.join(f'{name}="{attributes[name]}"' for name in _ACTIONABLE_ATTRIBUTES if attributes.get(name))
+		text = ' '.join(node.text(deep=True, separator=' ').split()) if node.tag != 'form' else ''
+		line = ' '.join(part for part in (node.tag, details, text) if part)
+		if line != node.tag:
+			lines.append(line)
+	return '\n'.join(lines)
+
+
+# Static instructions for page analysis. They go out as a fixed system message ahead of the
+# page content so every request shares a byte-identical prefix that providers can cache.
+_ANALYSIS_PROMPT_PREFIX = """Analyze the page content and extract all possible actions, variables, and their side effects. This analysis will be used to create workflow steps.
+
+Your task is to identify:
+1. All interactive elements (buttons, forms, inputs, links, dropdowns, etc.)
+2. Variables that can be filled or selected (form fields, search boxes, etc.)
+3. What happens when each action is performed (side effects like navigation, form submission, etc.)
+4. Whether each action is required for typical workflow completion
+
+For example:
+- For a search input: variable="search_term", action="enter search query", side_effect="triggers search results", is_required=true
+- For a submit button: variable="form_submission", action="click submit button", side_effect="submits form and navigates to next page", is_required=true
+- For optional fields: is_required=false"""
+_ANALYSIS_SYSTEM_MESSAGE = SystemMessage(content=_ANALYSIS_PROMPT_PREFIX)
 
 
 class ActionModel(BaseModel):
@@ -36,6 +150,13 @@ class HealingController(Controller):
 	):
 		super().__init__(exclude_actions=exclude_actions, output_model=output_model)
 		self.extraction_llm = extraction_llm
+		# LRU of analysis results keyed by (url, hash of the content that was analysed)
+		self._analysis_cache: OrderedDict[tuple[str, bytes], ActionResult] = OrderedDict()
+		# (url, hash of the raw HTML) of the previous call and its result, checked before any conversion
+		self._last_raw_key: tuple[str, bytes] | None = None
+		self._last_result: ActionResult | None = None
+		# Bound once and reused for every analysis
+		self._structured_analysis_llm = extraction_llm.with_structured_output(PageContentAnalysis, method='function_calling')
 
 		self.registry.action(
 			'Call this action EVERY TIME the content on the page changes or is new. This is very important for understanding workflows.'
@@ -46,37 +167,72 @@ class HealingController(Controller):
 
 		strip = ['a', 'img']
 
-		content = markdownify.markdownify(await page.content(), strip=strip)
-
-		for iframe in page.frames:
-			if iframe.url != page.url and not iframe.url.startswith('data:'):
-				content += f'\n\nIFRAME {iframe.url}:\n'
-				content += markdownify.markdownify(await iframe.content())
-
-		prompt = """Analyze the page content and extract all possible actions, variables, and their side effects. This analysis will be used to create workflow steps.
-
-Your task is to identify:
-1. All interactive elements (buttons, forms, inputs, links, dropdowns, etc.)
-2. Variables that can be filled or selected (form fields, search boxes, etc.)
-3. What happens when each action is performed (side effects like navigation, form submission, etc.)
-4. Whether each action is required for typical workflow completion
-
-For example:
-- For a search input: variable="search_term", action="enter search query", side_effect="triggers search results", is_required=true
-- For a submit button: variable="form_submission", action="click submit button", side_effect="submits form and navigates to next page", is_required=true
-- For optional fields: is_required=false
-
-Page content: {page}"""
-
-		template = PromptTemplate(input_variables=['page'], template=prompt)
+		frames = [iframe for iframe in page.frames if iframe.url != page.url and not iframe.url.startswith('data:')]
+
+		# Fetch every document at once, then convert them off the event loop
+		page_html, *frame_htmls = await asyncio.gather(page.content(), *(iframe.content() for iframe in frames))
+
+		# The agent often re-triggers this action on an unchanged page; skip straight to the previous result
+		raw_hash = hashlib.blake2b(digest_size=16)
+		for html in (page_html, *frame_htmls):
+			raw_hash.update(html.encode('utf-8'))
+		raw_key = (page.url, raw_hash.digest())
+		if raw_key == self._last_raw_key and self._last_result is not None:
+			logger.info(f'📄  Page unchanged since last analysis of {page.url}')
+			return self._last_result
+
+		if USE_FAST_HTML_TEXT and HTMLParser is not None:
+			page_markdown, *frame_markdowns = await asyncio.gather(
+				*(asyncio.to_thread(_html_to_action_text, html) for html in (page_html, *frame_htmls))
+			)
+		else:
+			page_markdown, *frame_markdowns = await asyncio.gather(
+				asyncio.to_thread(markdownify.markdownify, page_html, strip=strip),
+				*(asyncio.to_thread(markdownify.markdownify, html) for html in frame_htmls),
+			)
+
+		parts = [page_markdown]
+		for iframe, frame_markdown in zip(frames, frame_markdowns):
+			if not frame_markdown.strip():
+				continue
+			parts.append(f'\n\nIFRAME {iframe.url}:\n')
+			parts.append(frame_markdown)
+
+		# Loading the tokenizer (possibly a first-use download) and encoding are blocking, keep them off the loop
+		content = await asyncio.to_thread(_compact_for_llm, ''.join(parts))
+		cache_key = (page.url, hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest())
+
+		cached = self._analysis_cache.get(cache_key)
+		if cached is not None:
+			self._analysis_cache.move_to_end(cache_key)
+			logger.info(f'📄  Reusing page analysis for {page.url}')
+			self._last_raw_key, self._last_result = raw_key, cached
+			return cached
 
 		try:
-			structured_llm = self.extraction_llm.with_structured_output(PageContentAnalysis, method='function_calling')
-			output: PageContentAnalysis = await structured_llm.ainvoke(template.format(page=content))  # type: ignore
+			output = await self._invoke_analysis([_ANALYSIS_SYSTEM_MESSAGE, HumanMessage(content='Page content: ' + content)])
 		except Exception as e:
 			logger.error(f'Error extracting content: {e}')
 			return ActionResult(extracted_content=f'Error extracting content: {e}')
 
 		msg = f'📄  Extracted from page\n: {output.model_dump_json(indent=2)}\n'
 		logger.info(msg)
-		return ActionResult(extracted_content=msg, include_in_memory=True)
+		result = ActionResult(extracted_content=msg, include_in_memory=True)
+		self._analysis_cache[cache_key] = result
+		if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+			self._analysis_cache.popitem(last=False)
+		self._last_raw_key, self._last_result = raw_key, result
+		return result
+
+	async def _invoke_analysis(self, messages: list) -> PageContentAnalysis:
+		"""Send one page analysis to the extraction LLM, bounded by HEAL_LLM_CONCURRENCY."""
+		async with _llm_semaphore():
+			return await self._structured_analysis_llm.ainvoke(messages)  # type: ignore
+
+	def start_analysis(self, page: Page) -> asyncio.Task[ActionResult]:
+		"""Start analysing `page` in the background; await the task once the result is needed."""
+		return asyncio.create_task(self.analyse_page_content_and_extract_possible_actions(page))
+
+	async def analyse_many(self, pages: list[Page]) -> list[ActionResult]:
+		"""Analyse several pages concurrently, bounded by HEAL_LLM_CONCURRENCY."""
+		return await asyncio.gather(*(self.start_analysis(page) for page in pages))
@@ -1 +1,19 @@
-HEALING_AGENT_SYSTEM_PROMPT = open('workflow_use/healing/_agent/agent_prompt.md').read()
+import functools
+from importlib.resources import files
+
+
+def _read_prompt(*parts: str) -> str:
+	resource = files('workflow_use.healing')
+	for part in parts:
+		resource = resource.joinpath(part)
+	return resource.read_text(encoding='utf-8')
+
+
+@functools.cache
+def get_healing_agent_system_prompt() -> str:
+	return _read_prompt('_agent', 'agent_prompt.md')
+
+
+@functools.cache
+def get_workflow_creation_prompt() -> str:
+	return _read_prompt('prompts', 'workflow_creation_prompt.md')
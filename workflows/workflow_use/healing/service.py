@@ -1,8 +1,8 @@
+import asyncio
+import functools
 import hashlib
-import json
 from typing import Any, Dict, List, Sequence, Union
 
-import aiofiles
 from browser_use import Agent, AgentHistoryList, Browser
 from browser_use.agent.views import DOMHistoryElement
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -11,44 +11,101 @@ from patchright.async_api import async_playwright
 
 from workflow_use.builder.service import BuilderService
 from workflow_use.healing._agent.controller import HealingController
-from workflow_use.healing.prompts import HEALING_AGENT_SYSTEM_PROMPT
+from workflow_use.healing.prompts import get_healing_agent_system_prompt, get_workflow_creation_prompt
 from workflow_use.healing.views import ParsedAgentStep, SimpleDomElement, SimpleResult
 from workflow_use.schema.views import SelectorWorkflowSteps, WorkflowDefinitionSchema
 
+__all__ = ['HealingService']
+
+
+@functools.cache
+def _available_actions_markdown() -> str:
+	"""Actions markdown for the workflow prompt; the controller's actions are fixed, so build it once."""
+	return BuilderService._get_available_actions_markdown()
+
+
+# Base64 of the PNG signature; browser-use screenshots are PNGs
+_PNG_BASE64_PREFIX = 'iVBORw0KGgo'
+
+
+def _screenshot_digests(screenshots: list[str | None]) -> list[bytes | None]:
+	"""Hash each screenshot so identical frames are only sent once."""
+	return [hashlib.blake2b(s.encode(), digest_size=16).digest() if s else None for s in screenshots]
+
+
+def _screenshot_data_urls(screenshots: list[str]) -> list[str]:
+	"""Turn base64 screenshots into data URLs, leaving ones that already are data URLs untouched."""
+	data_urls = []
+	for screenshot in screenshots:
+		if screenshot.startswith('data:'):
+			data_urls.append(screenshot)
+		else:
+			mime_type = 'image/png' if screenshot.startswith(_PNG_BASE64_PREFIX) else 'image/jpeg'
+			data_urls.append(f'data:{mime_type};base64,{screenshot}')
+	return data_urls
+
 
 class HealingService:
 	def __init__(
 		self,
 		llm: BaseChatModel,
+		screenshot_stride: int = 1,
 	):
-		self.llm = llm
-
-		self.interacted_elements_hash_map: dict[str, DOMHistoryElement] = {}
+		if screenshot_stride < 1:
+			raise ValueError(f'screenshot_stride must be at least 1, got {screenshot_stride}')
 
-	def _remove_none_fields_from_dict(self, d: dict) -> dict:
-		return {k: v for k, v in d.items() if v is not None}
+		self.llm = llm
+		# Only every Nth step's screenshot is sent to the workflow-creation LLM
+		self.screenshot_stride = screenshot_stride
+		# Chain the model with the structured output schema once and reuse it for every workflow
+		self._structured_workflow_llm = llm.with_structured_output(WorkflowDefinitionSchema, method='function_calling')
 
-	def _history_to_workflow_definition(self, history_list: AgentHistoryList) -> list[HumanMessage]:
-		# history
+	async def _history_to_workflow_definition(
+		self,
+		history_list: AgentHistoryList,
+		interacted_elements_hash_map: dict[str, DOMHistoryElement],
+	) -> list[HumanMessage]:
+		"""Build one message per agent step, attaching every `screenshot_stride`-th screenshot unless an earlier step sent it."""
+		steps = [history for history in history_list.history if history.model_output is not None]
+		digests = await asyncio.to_thread(_screenshot_digests, [history.state.screenshot for history in steps])
+
+		# Pick the screenshots to attach, then build their data URLs off the event loop in one pass.
+		# The URLs are local to this call so they are freed once the messages are sent.
+		attached_steps: list[int] = []
+		attached_screenshots: list[str] = []
+		# Steps whose screenshot was already sent, mapped to the step that sent it
+		repeated: dict[int, int] = {}
+		seen: dict[bytes, int] = {}
+		for index, (history, digest) in enumerate(zip(steps, digests)):
+			screenshot = history.state.screenshot
+			if not screenshot or digest is None or index % self.screenshot_stride != 0:
+				continue
+			if digest in seen:
+				repeated[index] = seen[digest]
+				continue
+			seen[digest] = index
+			attached_steps.append(index)
+			attached_screenshots.append(screenshot)
+		data_urls = await asyncio.to_thread(_screenshot_data_urls, attached_screenshots)
+		attached = dict(zip(attached_steps, data_urls))
 
 		messages: list[HumanMessage] = []
 
-		for history in history_list.history:
-			if history.model_output is None:
-				continue
+		for index, history in enumerate(steps):
+			assert history.model_output is not None
 
 			interacted_elements: list[SimpleDomElement] = []
 			for element in history.state.interacted_element:
 				if element is None:
 					continue
 
-				# hash element by hacshing the tag_name + css_selector + highlight_index
-				element_hash = hashlib.sha256(
-					f'{element.tag_name}_{element.css_selector}_{element.highlight_index}'.encode()
-				).hexdigest()[:10]
+				# hash element by hashing the tag_name + css_selector + highlight_index (10 hex chars)
+				element_hash = hashlib.blake2b(
+					f'{element.tag_name}_{element.css_selector}_{element.highlight_index}'.encode(), digest_size=5
+				).hexdigest()
 
-				if element_hash not in self.interacted_elements_hash_map:
-					self.interacted_elements_hash_map[element_hash] = element
+				if element_hash not in interacted_elements_hash_map:
+					interacted_elements_hash_map[element_hash] = element
 
 				interacted_elements.append(
 					SimpleDomElement(
@@ -59,12 +116,11 @@ class HealingService:
 					)
 				)
 
-			screenshot = history.state.screenshot
 			parsed_step = ParsedAgentStep(
 				url=history.state.url,
 				title=history.state.title,
 				agent_brain=history.model_output.current_state,
-				actions=[self._remove_none_fields_from_dict(action.model_dump()) for action in history.model_output.action],
+				actions=[action.model_dump(exclude_none=True) for action in history.model_output.action],
 				results=[
 					SimpleResult(
 						success=result.success or False,
@@ -75,53 +131,54 @@ class HealingService:
 				interacted_elements=interacted_elements,
 			)
 
-			parsed_step_json = json.dumps(parsed_step.model_dump(exclude_none=True))
+			parsed_step_json = parsed_step.model_dump_json(exclude_none=True)
 			content_blocks: List[Union[str, Dict[str, Any]]] = []
 
-			text_block: Dict[str, Any] = {'type': 'text', 'text': parsed_step_json}
+			# Steps are numbered from 1 so repeated screenshots can point back at the step that sent them
+			text_block: Dict[str, Any] = {'type': 'text', 'text': f'Step {index + 1}: {parsed_step_json}'}
 			content_blocks.append(text_block)
 
-			if screenshot:
-				# Assuming screenshot is a base64 encoded string.
-				# Adjust mime type if necessary (e.g., image/png)
-				image_block: Dict[str, Any] = {'type': 'image_url', 'image_url': {'url': f'data:image/jpeg;base64,{screenshot}'}}
+			if index in repeated:
+				content_blocks.append({'type': 'text', 'text': f'screenshot: same as step {repeated[index] + 1}'})
+
+			data_url = attached.get(index)
+			if data_url is not None:
+				image_block: Dict[str, Any] = {'type': 'image_url', 'image_url': {'url': data_url}}
 				content_blocks.append(image_block)
 
 			messages.append(HumanMessage(content=content_blocks))
 
 		return messages
 
-	def _populate_selector_fields(self, workflow_definition: WorkflowDefinitionSchema) -> WorkflowDefinitionSchema:
+	def _populate_selector_fields(
+		self, workflow_definition: WorkflowDefinitionSchema, interacted_elements_hash_map: dict[str, DOMHistoryElement]
+	) -> WorkflowDefinitionSchema:
 		"""Populate cssSelector, xpath, and elementTag fields from interacted_elements_hash_map"""
-		# Process each step to add back the selector fields
-		for step in workflow_definition.steps:
-			if isinstance(step, SelectorWorkflowSteps):
-				if step.elementHash in self.interacted_elements_hash_map:
-					dom_element = self.interacted_elements_hash_map[step.elementHash]
-					step.cssSelector = dom_element.css_selector or ''
-					step.xpath = dom_element.xpath
-					step.elementTag = dom_element.tag_name
+		selector_steps = [step for step in workflow_definition.steps if isinstance(step, SelectorWorkflowSteps)]
+		# Process each selector step to add back the selector fields
+		for step in selector_steps:
+			dom_element = interacted_elements_hash_map.get(step.elementHash)
+			if dom_element is not None:
+				step.cssSelector = dom_element.css_selector or ''
+				step.xpath = dom_element.xpath
+				step.elementTag = dom_element.tag_name
 
 		# Create the full WorkflowDefinitionSchema with populated fields
 		return workflow_definition
 
 	async def create_workflow_definition(self, task: str, history_list: AgentHistoryList) -> WorkflowDefinitionSchema:
-		async with aiofiles.open('workflow_use/healing/prompts/workflow_creation_prompt.md', mode='r') as f:
-			prompt_content = await f.read()
-
-		prompt_content = prompt_content.format(goal=task, actions=BuilderService._get_available_actions_markdown())
+		prompt_content = get_workflow_creation_prompt().format(goal=task, actions=_available_actions_markdown())
 
 		system_message = SystemMessage(content=prompt_content)
-		human_messages = self._history_to_workflow_definition(history_list)
+		# Scoped to this call so the DOM elements are released once the workflow is built
+		interacted_elements_hash_map: dict[str, DOMHistoryElement] = {}
+		human_messages = await self._history_to_workflow_definition(history_list, interacted_elements_hash_map)
 
 		all_messages: Sequence[BaseMessage] = [system_message] + human_messages
 
-		# Chain the model with the structured output schema
-		structured_llm = self.llm.with_structured_output(WorkflowDefinitionSchema, method='function_calling')
-
-		workflow_definition: WorkflowDefinitionSchema = await structured_llm.ainvoke(all_messages)  # type: ignore
+		workflow_definition: WorkflowDefinitionSchema = await self._structured_workflow_llm.ainvoke(all_messages)  # type: ignore
 
-		workflow_definition = self._populate_selector_fields(workflow_definition)
+		workflow_definition = self._populate_selector_fields(workflow_definition, interacted_elements_hash_map)
 
 		return workflow_definition
 
@@ -144,7 +201,7 @@ class HealingService:
 				llm=agent_llm,
 				page_extraction_llm=extraction_llm,
 				controller=HealingController(extraction_llm=extraction_llm),
-				override_system_message=HEALING_AGENT_SYSTEM_PROMPT,
+				override_system_message=get_healing_agent_system_prompt(),
 				enable_memory=False,
 				max_failures=10,
 				tool_calling_method='auto',
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import logging
 import os
 
@@ -8,26 +9,31 @@ from patchright.async_api import async_playwright
 from pydantic import SecretStr
 
 from workflow_use.healing._agent.controller import HealingController
+from workflow_use.healing.prompts import get_healing_agent_system_prompt
 from workflow_use.healing.tests.constants import TASK_MESSAGE
 
 logger = logging.getLogger(__name__)
 
 
-llm = ChatOpenAI(
-	base_url='https://api.groq.com/openai/v1',
-	model='meta-llama/llama-4-maverick-17b-128e-instruct',
-	api_key=SecretStr(os.environ['GROQ_API_KEY']),
-	# model='gpt-4.1-mini',
-	temperature=0.0,
-)
-page_extraction_llm = ChatOpenAI(
-	base_url='https://api.groq.com/openai/v1',
-	model='meta-llama/llama-4-scout-17b-16e-instruct',
-	api_key=SecretStr(os.environ['GROQ_API_KEY']),
-	temperature=0.0,
-)
+@functools.lru_cache(maxsize=None)
+def _llm() -> ChatOpenAI:
+	return ChatOpenAI(
+		base_url='https://api.groq.com/openai/v1',
+		model='meta-llama/llama-4-maverick-17b-128e-instruct',
+		api_key=SecretStr(os.environ['GROQ_API_KEY']),
+		# model='gpt-4.1-mini',
+		temperature=0.0,
+	)
 
-system_prompt = open('workflow_use/healing/_agent/agent_prompt.md').read()
+
+@functools.lru_cache(maxsize=None)
+def _page_extraction_llm() -> ChatOpenAI:
+	return ChatOpenAI(
+		base_url='https://api.groq.com/openai/v1',
+		model='meta-llama/llama-4-scout-17b-16e-instruct',
+		api_key=SecretStr(os.environ['GROQ_API_KEY']),
+		temperature=0.0,
+	)
 
 
 async def explore_page():
@@ -37,10 +43,10 @@ async def explore_page():
 		agent = Agent(
 			task=TASK_MESSAGE,
 			browser_session=browser,
-			llm=llm,
-			page_extraction_llm=page_extraction_llm,
-			controller=HealingController(extraction_llm=page_extraction_llm),
-			override_system_message=system_prompt,
+			llm=_llm(),
+			page_extraction_llm=_page_extraction_llm(),
+			controller=HealingController(extraction_llm=_page_extraction_llm()),
+			override_system_message=get_healing_agent_system_prompt(),
 			enable_memory=False,
 			max_failures=10,
 			# max_actions_per_step=1,
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import os
 from pathlib import Path
 
@@ -58,7 +57,7 @@ async def test_generate_workflow_from_prompt():
 		file_save_path.parent.mkdir(exist_ok=True)
 
 		async with aiofiles.open(file_save_path, mode='w') as f:
-			await f.write(json.dumps(workflow_definition.model_dump(), indent=2))
+			await f.write(workflow_definition.model_dump_json(indent=2))
 
 		print(f'Workflow definition saved to {file_save_path}')
 		print(f'Generated {len(workflow_definition.steps)} workflow steps')
@@ -1,5 +1,4 @@
 import asyncio
-import json
 from pathlib import Path
 
 import aiofiles
@@ -21,7 +20,9 @@ WorkflowAgentOutput = AgentOutput.type_with_custom_actions(ActionModel)
 async def test_workflow_creation():
 	healing_service = HealingService(llm)
 
-	history_list = AgentHistoryList.load_from_file('./tmp/history.json', output_model=WorkflowAgentOutput)
+	history_list = await asyncio.to_thread(
+		AgentHistoryList.load_from_file, './tmp/history.json', output_model=WorkflowAgentOutput
+	)
 
 	workflow_definition = await healing_service.create_workflow_definition(TASK_MESSAGE, history_list)
 
@@ -29,7 +30,7 @@ async def test_workflow_creation():
 
 	# save to json
 	async with aiofiles.open(file_save_path, mode='w') as f:
-		await f.write(json.dumps(workflow_definition.model_dump(), indent=2))
+		await f.write(workflow_definition.model_dump_json(indent=2))
 
 	print(f'file saved to {file_save_path}')
 
@@ -0,0 +1,20 @@
+import json
+
+try:
+	import orjson
+except ImportError:  # orjson is an optional speedup, fall back to the stdlib json module
+	orjson = None
+
+
+def json_loads(data: bytes | str):
+	"""Parse a JSON document, using orjson when it is available."""
+	if orjson is not None:
+		return orjson.loads(data)
+	return json.loads(data)
+
+
+def json_dumps(data, indent: bool = False, default=None) -> bytes:
+	"""Serialize data to UTF-8 encoded JSON, using orjson when it is available."""
+	if orjson is not None:
+		return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 if indent else 0)
+	return json.dumps(data, indent=2 if indent else None, default=default, ensure_ascii=False).encode('utf-8')
@@ -1,12 +1,28 @@
 # Enhanced recorder with comprehensive event types and intelligent merging
 import asyncio
-import json
+import re
+from collections import deque
 from typing import Dict, List, Optional, Union
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
+from pydantic import TypeAdapter
+
+from workflow_use.json_utils import json_dumps
 from workflow_use.recorder.service import RecordingService  # Adjust import path if necessary
 
 
+# Patterns for pulling a label's `for` target and an input's id out of recorded CSS selectors
+_LABEL_FOR_RE = re.compile(r'\[for=["\']([^"\']+)["\']\]')
+_ID_ATTR_RE = re.compile(r'\[id=["\']([^"\']+)["\']\]')
+_ID_HASH_RE = re.compile(r'#([a-zA-Z][a-zA-Z0-9_-]*)')
+
+
+# Tags that may act as buttons, and the text/class fragments that suggest they do
+_BUTTON_LIKE_TAGS = frozenset(('a', 'span', 'div'))
+_BUTTON_KEYWORDS = ('submit', 'save', 'send', 'continue', 'next', 'confirm', 'cancel', 'close', 'ok', 'apply')
+_BUTTON_CLASSES = ('btn', 'button', 'submit')
+
+
 @dataclass
 class BaseEvent:
 	"""Base class for all recorded events."""
@@ -129,6 +145,12 @@ class ButtonEvent(BaseEvent):
 	xpath: str = ""
 
 
+# Serializes a mixed list of recorded events in one pass; built once since schema generation is costly
+_EVENT_LIST_ADAPTER = TypeAdapter(
+	List[Union[NavigationEvent, ClickEvent, InputEvent, RadioEvent, SelectEvent, CheckboxEvent, ButtonEvent]]
+)
+
+
 class EnhancedRecordingService(RecordingService):
 	"""Enhanced recording service with better event type detection and merging."""
 	
@@ -137,6 +159,9 @@ class EnhancedRecordingService(RecordingService):
 		self.pending_events: List[BaseEvent] = []
 		self.last_click_timestamp = 0
 		self.label_click_window_ms = 1000  # Time window to merge label clicks with input focus
+		# Pending label clicks keyed by their `for` target, plus (timestamp, target) pairs in arrival order for expiry
+		self._label_by_for: Dict[str, tuple[int, ClickEvent]] = {}
+		self._label_for_expiry: deque[tuple[int, str]] = deque()
 	
 	async def process_raw_event(self, raw_event: Dict) -> Optional[BaseEvent]:
 		"""Process a raw event from the browser extension into a typed event."""
@@ -402,14 +427,30 @@ class EnhancedRecordingService(RecordingService):
 		# Check if there was a recent label click that should be merged
 		current_time = payload.get('timestamp', 0)
 		
-		# Look for recent label clicks to merge
+		self._expire_label_targets(current_time)
+		
+		# A label whose `for` points at this input is the best match
+		input_id = self._extract_input_id(payload.get('cssSelector', ''))
+		entry = self._label_by_for.pop(input_id, None) if input_id else None
+		if entry is not None:
+			timestamp, event = entry
+			index = self._pending_index(event)
+			if index is not None and current_time - timestamp <= self.label_click_window_ms:
+				# Remove the label click and create a merged input focus
+				self.pending_events.pop(index)
+				return await self._create_merged_input_event(event, payload, semantic_info)
+		
+		# Otherwise fall back to a recent label click on the same page
 		for i, event in enumerate(self.pending_events):
 			if (isinstance(event, ClickEvent) and 
-				current_time - event.timestamp <= self.label_click_window_ms and
-				self._events_should_merge(event, payload)):
+				payload.get('url') == event.url and
+				abs(current_time - event.timestamp) <= self.label_click_window_ms):
 				
 				# Remove the label click and create a merged input focus
 				self.pending_events.pop(i)
+				label_for = self._extract_label_for_attribute(event.css_selector)
+				if label_for and self._label_by_for.get(label_for, (None, None))[1] is event:
+					del self._label_by_for[label_for]
 				return await self._create_merged_input_event(event, payload, semantic_info) 
 		
 		# No merge needed, just record focus if relevant
@@ -440,22 +481,28 @@ class EnhancedRecordingService(RecordingService):
 		self.pending_events.append(event)
 		self.last_click_timestamp = event.timestamp
 		
+		label_for = self._extract_label_for_attribute(event.css_selector)
+		if label_for:
+			self._label_by_for[label_for] = (event.timestamp, event)
+			self._label_for_expiry.append((event.timestamp, label_for))
+		
 		# Return None initially - will be finalized later if not merged
 		return None
 	
-	def _events_should_merge(self, label_click: ClickEvent, input_payload: Dict) -> bool:
-		"""Determine if a label click and input focus should be merged."""
-		# Check if the label is associated with the input field
-		label_for = self._extract_label_for_attribute(label_click.css_selector)
-		input_id = self._extract_input_id(input_payload.get('cssSelector', ''))
-		
-		if label_for and input_id and label_for == input_id:
-			return True
-		
-		# Check proximity and context
-		# This is a simplified check - in practice you might want more sophisticated logic
-		return (input_payload.get('url') == label_click.url and
-				abs(input_payload.get('timestamp', 0) - label_click.timestamp) <= self.label_click_window_ms)
+	def _expire_label_targets(self, current_time: int) -> None:
+		"""Forget `for` targets of label clicks that are too old to merge."""
+		while self._label_for_expiry and current_time - self._label_for_expiry[0][0] > self.label_click_window_ms:
+			timestamp, label_for = self._label_for_expiry.popleft()
+			entry = self._label_by_for.get(label_for)
+			if entry is not None and entry[0] == timestamp:
+				del self._label_by_for[label_for]
+	
+	def _pending_index(self, event: BaseEvent) -> Optional[int]:
+		"""Return the position of this exact event object in pending_events, if still pending."""
+		for i, pending in enumerate(self.pending_events):
+			if pending is event:
+				return i
+		return None
 	
 	async def _create_merged_input_event(self, label_click: ClickEvent, input_payload: Dict, semantic_info: Dict) -> InputEvent:
 		"""Create a merged input event from label click + input focus."""
@@ -486,20 +533,18 @@ class EnhancedRecordingService(RecordingService):
 	
 	def _extract_label_for_attribute(self, css_selector: str) -> Optional[str]:
 		"""Extract the 'for' attribute value from a label's CSS selector."""
-		import re
-		match = re.search(r'\[for=["\']([^"\']+)["\']\]', css_selector)
+		match = _LABEL_FOR_RE.search(css_selector)
 		return match.group(1) if match else None
 	
 	def _extract_input_id(self, css_selector: str) -> Optional[str]:
 		"""Extract the ID from an input's CSS selector."""
-		import re
 		# Try [id="..."] format first
-		match = re.search(r'\[id=["\']([^"\']+)["\']\]', css_selector)
+		match = _ID_ATTR_RE.search(css_selector)
 		if match:
 			return match.group(1)
 		
 		# Try #id format
-		match = re.search(r'#([a-zA-Z][a-zA-Z0-9_-]*)', css_selector)
+		match = _ID_HASH_RE.search(css_selector)
 		return match.group(1) if match else None
 
 	def _is_button_like_element(self, payload: Dict, semantic_info: Dict) -> bool:
@@ -512,17 +557,15 @@ class EnhancedRecordingService(RecordingService):
 			return True
 		
 		# Check for clickable elements that might be styled as buttons
-		button_like_tags = ['a', 'span', 'div']
-		if element_tag in button_like_tags:
+		if element_tag in _BUTTON_LIKE_TAGS:
 			# Check if element has button-like characteristics
 			target_text = payload.get('targetText', '').lower()
-			button_keywords = ['submit', 'save', 'send', 'continue', 'next', 'confirm', 'cancel', 'close', 'ok', 'apply']
-			
-			if any(keyword in target_text for keyword in button_keywords):
+			if any(keyword in target_text for keyword in _BUTTON_KEYWORDS):
 				return True
 			
 			# Check for button-like CSS classes
-			if any(cls in css_selector.lower() for cls in ['btn', 'button', 'submit']):
+			lowered_selector = css_selector.lower()
+			if any(cls in lowered_selector for cls in _BUTTON_CLASSES):
 				return True
 		
 		return False
@@ -531,20 +574,13 @@ class EnhancedRecordingService(RecordingService):
 		"""Finalize any pending events that weren't merged."""
 		finalized = self.pending_events.copy()
 		self.pending_events.clear()
+		self._label_by_for.clear()
+		self._label_for_expiry.clear()
 		return finalized
 	
 	def export_events_to_workflow(self, events: List[BaseEvent]) -> Dict:
 		"""Export the processed events to workflow format."""
-		workflow_steps = []
-		
-		for event in events:
-			step = asdict(event)
-			# Clean up the step format for workflow compatibility
-			if hasattr(event, 'options') and event.options:
-				# Keep options for radio and select events
-				step['options'] = event.options
-			
-			workflow_steps.append(step)
+		workflow_steps = _EVENT_LIST_ADAPTER.dump_python(events)
 		
 		return {
 			"workflow_analysis": "Enhanced recorded workflow with comprehensive event types and intelligent merging",
@@ -571,7 +607,7 @@ async def run_enhanced_recording():
 			print(workflow_schema.model_dump_json(indent=2))
 		except AttributeError:
 			# Fallback if model_dump_json isn't available
-			print(json.dumps(workflow_schema, indent=2, default=str))
+			print(json_dumps(workflow_schema, indent=True, default=str).decode('utf-8'))
 		print('------------------------------------')
 	else:
 		print('No workflow was captured.')
@@ -0,0 +1,31 @@
+import asyncio
+import threading
+
+
+async def run_in_daemon_thread(func, *args, name: str = 'blocking-call', **kwargs):
+	"""Run a blocking call in a daemon thread and await its result without blocking the event loop.
+
+	Unlike asyncio.to_thread, the thread is a daemon: for calls that block on stdin, a cancelled wait
+	(e.g. after Ctrl+C) leaves the thread behind without keeping the interpreter from exiting.
+	"""
+	loop = asyncio.get_running_loop()
+	future = loop.create_future()
+
+	def _settle(setter, value):
+		if not future.done():
+			setter(value)
+
+	def _run():
+		try:
+			result = func(*args, **kwargs)
+		except BaseException as e:
+			settle = (_settle, future.set_exception, e)
+		else:
+			settle = (_settle, future.set_result, result)
+		try:
+			loop.call_soon_threadsafe(*settle)
+		except RuntimeError:
+			pass  # The loop already closed, nobody is waiting for this result
+
+	threading.Thread(target=_run, name=name, daemon=True).start()
+	return await future
@@ -29,6 +29,10 @@ class SemanticWorkflowExecutor:
         self.browser = browser
         self.semantic_extractor = SemanticExtractor()
         self.current_mapping: Dict[str, Dict] = {}
+        # Bumped on every refresh so callers can key caches on the mapping they resolved against
+        self.mapping_version = 0
+        # Lowercased mapping keys, rebuilt alongside current_mapping
+        self._lower_keys: Dict[str, str] = {}
         self.max_retries = max_retries
         self.max_global_failures = max_global_failures
         self.max_verification_failures = max_verification_failures
@@ -42,6 +46,8 @@ class SemanticWorkflowExecutor:
         """Refresh the semantic mapping for the current page."""
         page = await self.browser.get_current_page()
         self.current_mapping = await self.semantic_extractor.extract_semantic_mapping(page)
+        self.mapping_version += 1
+        self._lower_keys = {text: text.lower() for text in self.current_mapping}
         logger.info(f"Refreshed semantic mapping with {len(self.current_mapping)} elements")
         
         # Print detailed mapping for debugging
@@ -51,6 +57,11 @@ class SemanticWorkflowExecutor:
                 logger.debug(f"'{text}' -> {element_info['selectors']} (fallback: {element_info.get('fallback_selector', 'none')})")
             logger.debug("=== End Semantic Mapping ===")
        
+    def _lower_key(self, text: str) -> str:
+        """Lowercase a mapping key, reusing the copy cached at refresh time."""
+        lower = self._lower_keys.get(text)
+        return lower if lower is not None else text.lower()
+    
     def _find_element_by_text(self, target_text: str, context_hints: List[str] = None) -> Optional[Dict]:
         """Find element by visible text using semantic mapping with improved hierarchical fallback strategies."""
         if not target_text:
@@ -77,7 +88,7 @@ class SemanticWorkflowExecutor:
         best_hierarchical_score = 0
         
         for text, element_info in self.current_mapping.items():
-            text_lower = text.lower()
+            text_lower = self._lower_key(text)
             original_text = element_info.get('original_text', '').lower()
             
             # Check if target matches either the full text or original text
@@ -125,7 +136,7 @@ class SemanticWorkflowExecutor:
         
         # Strategy 2: Try partial matches with different strategies (original fallback)
         for text, element_info in self.current_mapping.items():
-            text_lower = text.lower()
+            text_lower = self._lower_key(text)
             original_text = element_info.get('original_text', '').lower()
             
             # Check if target text is contained in element text (more lenient)
@@ -148,7 +159,7 @@ class SemanticWorkflowExecutor:
         best_score = 0
         
         for text, element_info in self.current_mapping.items():
-            text_words = text.lower().split()
+            text_words = self._lower_key(text).split()
             original_words = element_info.get('original_text', '').lower().split()
             
             # Calculate word overlap score for both full text and original text
@@ -1035,7 +1046,7 @@ class SemanticWorkflowExecutor:
     async def execute_scroll_step(self, step: ScrollStep) -> ActionResult:
         """Execute scroll step."""
         page = await self.browser.get_current_page()
-        await page.evaluate(f"window.scrollBy({step.scrollX}, {step.scrollY})")
+        await page.evaluate("([x, y]) => window.scrollBy(x, y)", [step.scrollX, step.scrollY])
         
         msg = f"📜 Scrolled by ({step.scrollX}, {step.scrollY})"
         logger.info(msg)
@@ -1671,7 +1682,7 @@ class SemanticWorkflowExecutor:
             # Convert page HTML to clean markdown, removing unnecessary elements
             strip_tags = ['a', 'img', 'script', 'style', 'nav', 'header', 'footer']
             html_content = await page.content()
-            markdown_content = markdownify.markdownify(html_content, strip=strip_tags)
+            parts = [markdownify.markdownify(html_content, strip=strip_tags)]
             
             # Include iframe content for comprehensive extraction
             for iframe in page.frames:
@@ -1679,9 +1690,10 @@ class SemanticWorkflowExecutor:
                     try:
                         iframe_content = await iframe.content()
                         iframe_markdown = markdownify.markdownify(iframe_content, strip=strip_tags)
-                        markdown_content += f'\n\n=== IFRAME {iframe.url} ===\n{iframe_markdown}\n'
+                        parts.append(f'\n\n=== IFRAME {iframe.url} ===\n{iframe_markdown}\n')
                     except Exception as e:
                         logger.debug(f"Could not extract iframe content from {iframe.url}: {e}")
+            markdown_content = ''.join(parts)
             
             # Limit content size to avoid token limits (keep most relevant content)
             max_content_length = 50000  # Adjust based on your LLM's context window
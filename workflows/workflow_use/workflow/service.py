@@ -43,7 +43,7 @@ class Workflow:
 	def __init__(
 		self,
 		workflow_schema: WorkflowDefinitionSchema,
-		llm: BaseChatModel,
+		llm: BaseChatModel | None,
 		*,
 		controller: WorkflowController | None = None,
 		browser: Browser | None = None,
@@ -86,7 +86,7 @@ class Workflow:
 	def load_from_file(
 		cls,
 		file_path: str | Path,
-		llm: BaseChatModel,
+		llm: BaseChatModel | None,
 		*,
 		controller: WorkflowController | None = None,
 		browser: Browser | None = None,
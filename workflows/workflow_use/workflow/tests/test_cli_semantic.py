@@ -0,0 +1,153 @@
+"""
+Tests for the semantic matching, selector extraction and mapping cache helpers in cli.py.
+"""
+
+import os
+import time
+
+import pytest
+
+import cli
+
+
+def _baseline_find_best_semantic_match(element_text, semantic_mapping):
+	"""The original linear-scan matcher, kept to check the indexed matcher picks the same keys."""
+	if not element_text or not semantic_mapping:
+		return None
+
+	element_text_lower = element_text.lower().strip()
+
+	for text_key in semantic_mapping.keys():
+		if text_key.lower() == element_text_lower:
+			return text_key
+
+	for text_key in semantic_mapping.keys():
+		if element_text_lower in text_key.lower() or text_key.lower() in element_text_lower:
+			return text_key
+
+	return element_text
+
+
+SEMANTIC_MAPPING = {
+	'Search': {'selectors': '#search'},
+	'First Name': {'selectors': '#first-name'},
+	'Last Name': {'selectors': '#last-name'},
+	'Submit Application': {'selectors': 'button[type="submit"]'},
+	'SUBMIT': {'selectors': '#submit-top'},
+	'Name': {'selectors': '[name="name"]'},
+}
+
+
+@pytest.fixture
+def semantic_mapping_lower():
+	return cli._index_semantic_mapping(SEMANTIC_MAPPING)
+
+
+@pytest.mark.parametrize(
+	'element_text, expected',
+	[
+		# Exact matches ignore case and surrounding whitespace
+		('search', 'Search'),
+		('  First Name  ', 'First Name'),
+		('submit', 'SUBMIT'),
+		# Partial matches return the first key in mapping order
+		('Submit App', 'Submit Application'),
+		('Enter your first name here', 'First Name'),
+		('name', 'Name'),
+		('Last', 'Last Name'),
+		# No match falls back to the element text itself
+		('Checkout', 'Checkout'),
+	],
+)
+def test_find_best_semantic_match(semantic_mapping_lower, element_text, expected):
+	assert cli._find_best_semantic_match(element_text, semantic_mapping_lower) == expected
+	assert _baseline_find_best_semantic_match(element_text, SEMANTIC_MAPPING) == expected
+
+
+def test_find_best_semantic_match_prefers_mapping_order_over_first_character():
+	semantic_mapping = {'Email address': {}, 'Address': {}}
+	semantic_mapping_lower = cli._index_semantic_mapping(semantic_mapping)
+
+	assert cli._find_best_semantic_match('address', semantic_mapping_lower) == 'Address'
+	assert cli._find_best_semantic_match('addr', semantic_mapping_lower) == 'Email address'
+	assert _baseline_find_best_semantic_match('addr', semantic_mapping) == 'Email address'
+
+
+def test_find_best_semantic_match_keeps_first_key_differing_only_by_case():
+	semantic_mapping = {'Submit': {}, 'SUBMIT': {}}
+	semantic_mapping_lower = cli._index_semantic_mapping(semantic_mapping)
+
+	assert cli._find_best_semantic_match('submit', semantic_mapping_lower) == 'Submit'
+	assert _baseline_find_best_semantic_match('submit', semantic_mapping) == 'Submit'
+
+
+def test_find_best_semantic_match_without_text_or_mapping(semantic_mapping_lower):
+	assert cli._find_best_semantic_match('', semantic_mapping_lower) is None
+	assert cli._find_best_semantic_match('Search', {}) is None
+
+
+def test_match_semantic_key_returns_none_without_match(semantic_mapping_lower):
+	assert cli._match_semantic_key('Checkout', semantic_mapping_lower) is None
+
+
+@pytest.mark.parametrize(
+	'css_selector, expected',
+	[
+		('#email', 'email'),
+		('input#first_name', 'first_name'),
+		('#search-box[type="text"]', 'search-box'),
+		('#login.primary', 'login'),
+		('input[name="username"]', 'username'),
+		("input[name='password']", 'password'),
+		('select[name=country]', 'country'),
+		('#email[name="ignored"]', 'email'),
+		('button.primary', None),
+		('', None),
+		(None, None),
+	],
+)
+def test_extract_target_from_selector(css_selector, expected):
+	assert cli._extract_target_from_selector(css_selector) == expected
+
+
+@pytest.fixture
+def semantic_cache(tmp_path, monkeypatch):
+	monkeypatch.setattr(cli, 'SEMANTIC_CACHE_DIR', tmp_path / 'semantic_cache')
+	monkeypatch.delenv('WORKFLOW_NO_CACHE', raising=False)
+	return tmp_path / 'semantic_cache'
+
+
+def test_semantic_cache_path_is_stable_per_url(semantic_cache):
+	url = 'https://example.com/form'
+
+	assert cli._semantic_cache_path(url) == cli._semantic_cache_path(url)
+	assert cli._semantic_cache_path(url) != cli._semantic_cache_path('https://example.com/other')
+	assert cli._semantic_cache_path(url).parent == semantic_cache
+
+
+def test_semantic_cache_hit(semantic_cache):
+	url = 'https://example.com/form'
+
+	assert cli._load_cached_semantic_mapping(url) is None
+	cli._store_cached_semantic_mapping(url, SEMANTIC_MAPPING)
+	assert cli._load_cached_semantic_mapping(url) == SEMANTIC_MAPPING
+
+
+def test_semantic_cache_expires_after_ttl(semantic_cache):
+	url = 'https://example.com/form'
+	cli._store_cached_semantic_mapping(url, SEMANTIC_MAPPING)
+
+	expired = time.time() - cli.SEMANTIC_CACHE_TTL_SECONDS - 1
+	os.utime(cli._semantic_cache_path(url), (expired, expired))
+
+	assert cli._load_cached_semantic_mapping(url) is None
+
+
+def test_semantic_cache_bypassed_with_workflow_no_cache(semantic_cache, monkeypatch):
+	url = 'https://example.com/form'
+	cli._store_cached_semantic_mapping(url, SEMANTIC_MAPPING)
+	monkeypatch.setenv('WORKFLOW_NO_CACHE', '1')
+
+	assert cli._load_cached_semantic_mapping(url) is None
+	cli._store_cached_semantic_mapping('https://example.com/other', SEMANTIC_MAPPING)
+	assert not cli._semantic_cache_path('https://example.com/other').exists()